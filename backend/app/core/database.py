@@ -17,11 +17,24 @@ ASYNC_DATABASE_URL = settings.DATABASE_URL.replace(
 # Create async engine
 engine = create_async_engine(
     ASYNC_DATABASE_URL,
-    echo=settings.DEBUG,
+    echo=settings.SQL_ECHO,
     future=True,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_size=settings.POOL_SIZE,
+    max_overflow=settings.MAX_OVERFLOW,
+    pool_recycle=settings.POOL_RECYCLE,
+    connect_args={
+        # asyncpg statement cache and SQLAlchemy's prepared statement cache
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 256,
+        # Per-connection session settings, sent once in the startup packet.
+        # Short OLTP queries don't benefit from JIT compilation.
+        "server_settings": {
+            "application_name": "waste-incident-api",
+            "jit": "off",
+            "statement_timeout": str(settings.STATEMENT_TIMEOUT_MS)
+        }
+    }
 )
 
 # Create async session factory
@@ -52,23 +65,186 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_db_readonly() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting a read-only database session
+    
+    Skips the commit round-trip for SELECT-only endpoints; the session never
+    commits, so the transaction is rolled back when it closes.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+def _create_missing_indexes(sync_conn):
+    """Create model-declared indexes that don't exist yet"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+async def _backfill_quantized_embeddings(conn):
+    """Fill embedding_i8/embedding_scale for rows that only have the vector"""
+    from sqlalchemy import bindparam, select, update
+    from app.modules.ai.service import quantize_embedding
+    from app.modules.incidents.models import Incident
+    
+    incidents = Incident.__table__
+    result = await conn.execute(
+        select(incidents.c.id, incidents.c.embedding).where(
+            incidents.c.embedding.isnot(None),
+            incidents.c.embedding_i8.is_(None)
+        )
+    )
+    params = []
+    for incident_id, embedding in result:
+        quantized, scale = quantize_embedding(embedding.to_numpy())
+        params.append({"b_id": incident_id, "b_i8": quantized.tobytes(), "b_scale": scale})
+    
+    if not params:
+        return
+    
+    await conn.execute(
+        update(incidents)
+        .where(incidents.c.id == bindparam("b_id"))
+        .values(embedding_i8=bindparam("b_i8"), embedding_scale=bindparam("b_scale")),
+        params
+    )
+    logger.info(f"Backfilled int8 embeddings for {len(params)} incidents")
+
+
 async def init_db():
     """
     Initialize database - create tables and enable pgvector extension
     """
+    if not settings.RUN_MIGRATIONS:
+        logger.info("RUN_MIGRATIONS disabled - skipping schema initialization")
+        return
+    
     logger.info("Initializing database")
     
     # Import models to register them with Base.metadata
-    from app.modules.incidents.models import Incident  # noqa: F401
+    from app.modules.incidents.models import Incident, IncidentKeyword  # noqa: F401
     
     async with engine.begin() as conn:
-        # Enable pgvector extension
-        try:
-            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
-            logger.info("pgvector extension enabled")
-        except Exception as e:
-            logger.warning(f"Could not enable pgvector extension: {e}")
+        # DDL (e.g. index builds) may legitimately exceed the API statement timeout
+        await conn.execute(text("SET LOCAL statement_timeout = 0"))
+        
+        # Enable pgvector extension (skip the DDL when already installed)
+        vector_installed = await conn.scalar(
+            text("SELECT 1 FROM pg_catalog.pg_extension WHERE extname = 'vector'")
+        )
+        if vector_installed:
+            logger.info("pgvector extension already enabled")
+        else:
+            try:
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+                logger.info("pgvector extension enabled")
+            except Exception as e:
+                logger.warning(f"Could not enable pgvector extension: {e}")
+        
+        # Trigram matching for the ILIKE filter indexes
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables created")
+        
+        # create_all skips indexes on tables that already exist
+        await conn.run_sync(_create_missing_indexes)
+        
+        # Indexes superseded by the covering indexes (waste_type alone is
+        # still served by ix_incidents_waste_type)
+        await conn.execute(text("DROP INDEX IF EXISTS idx_waste_type, idx_incidents_ts_waste"))
+        
+        # incident_keywords mirrors incidents.keywords for every write path
+        await conn.execute(text(
+            "CREATE OR REPLACE FUNCTION sync_incident_keywords() RETURNS trigger AS $$ "
+            "BEGIN "
+            "DELETE FROM incident_keywords WHERE incident_id = NEW.id; "
+            "INSERT INTO incident_keywords (incident_id, keyword) "
+            "SELECT DISTINCT NEW.id, k FROM unnest(NEW.keywords) AS k WHERE k IS NOT NULL; "
+            "RETURN NULL; "
+            "END $$ LANGUAGE plpgsql"
+        ))
+        await conn.execute(text("DROP TRIGGER IF EXISTS incidents_keywords_sync ON incidents"))
+        await conn.execute(text(
+            "CREATE TRIGGER incidents_keywords_sync "
+            "AFTER INSERT OR UPDATE OF keywords ON incidents "
+            "FOR EACH ROW EXECUTE FUNCTION sync_incident_keywords()"
+        ))
+        
+        # Backfill from the array column the first time the table is used
+        await conn.execute(text(
+            "INSERT INTO incident_keywords (incident_id, keyword) "
+            "SELECT DISTINCT i.id, k FROM incidents i, unnest(i.keywords) AS k "
+            "WHERE k IS NOT NULL AND NOT EXISTS (SELECT 1 FROM incident_keywords) "
+            "ON CONFLICT DO NOTHING"
+        ))
+        
+        # Columns added after the table was first created
+        await conn.execute(text(
+            "ALTER TABLE incidents "
+            "ADD COLUMN IF NOT EXISTS embedding_i8 bytea, "
+            "ADD COLUMN IF NOT EXISTS embedding_scale double precision"
+        ))
+        
+        # Migrate a pre-existing fp32 vector embedding column to halfvec
+        embedding_type = await conn.scalar(text(
+            "SELECT format_type(atttypid, atttypmod) FROM pg_catalog.pg_attribute "
+            "WHERE attrelid = 'incidents'::regclass AND attname = 'embedding'"
+        ))
+        if embedding_type and embedding_type.startswith("vector"):
+            await conn.execute(text("DROP INDEX IF EXISTS incidents_embedding_hnsw, incidents_embedding_hnsw_ip"))
+            await conn.execute(text(
+                "ALTER TABLE incidents ALTER COLUMN embedding "
+                "TYPE halfvec(384) USING embedding::halfvec(384)"
+            ))
+            logger.info("Converted embedding column to halfvec")
+        
+        # Daily rollup for analytics; the unique index allows REFRESH ... CONCURRENTLY
+        try:
+            async with conn.begin_nested():
+                await conn.execute(text(
+                    "CREATE MATERIALIZED VIEW IF NOT EXISTS incidents_daily_rollup AS "
+                    "SELECT date(timestamp) AS day, waste_type, location, count(*) AS count "
+                    "FROM incidents GROUP BY 1, 2, 3"
+                ))
+                await conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS incidents_daily_rollup_key "
+                    "ON incidents_daily_rollup (day, waste_type, location) NULLS NOT DISTINCT"
+                ))
+            logger.info("Daily analytics rollup ensured")
+        except Exception as e:
+            logger.warning(f"Could not create daily analytics rollup: {e}")
+        
+        # int8 copies for rows embedded before the quantized columns existed
+        await _backfill_quantized_embeddings(conn)
+        
+        # HNSW index for similarity search on embeddings. Embeddings are
+        # unit-length, so inner product ranks like cosine without the norms;
+        # it supersedes the earlier cosine-ops index.
+        # (savepoint so a failure doesn't abort the surrounding transaction)
+        try:
+            async with conn.begin_nested():
+                await conn.execute(text("DROP INDEX IF EXISTS incidents_embedding_hnsw"))
+                await conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS incidents_embedding_hnsw_ip "
+                    "ON incidents USING hnsw (embedding halfvec_ip_ops)"
+                ))
+            logger.info("Embedding HNSW index ensured")
+        except Exception as e:
+            logger.warning(f"Could not create embedding HNSW index: {e}")
+
+
+async def warmup_db():
+    """
+    Establish a pooled connection before traffic so the first request
+    doesn't pay connection setup and authentication
+    """
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    logger.info("Database connection pool warmed up")
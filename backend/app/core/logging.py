@@ -3,18 +3,24 @@ Structured Logging Configuration
 """
 import logging
 import sys
-from pythonjsonlogger import jsonlogger
-from datetime import datetime
 from typing import Any, Dict
+import orjson
 import structlog
 
 from app.core.config import settings
 
 
+def _orjson_dumps(obj: Any, **kwargs) -> str:
+    """Serialize with orjson, returning str as expected by stdlib loggers"""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
 class AuditLogger:
     """Audit logging for tracking user actions and system events"""
     
     def __init__(self):
+        # Lazy proxy; bound once on first use (cache_logger_on_first_use)
+        # and timestamped by the TimeStamper processor
         self.logger = structlog.get_logger("audit")
     
     def log_action(
@@ -34,40 +40,53 @@ class AuditLogger:
             resource_id=resource_id,
             user_id=user_id,
             details=details or {},
-            status=status,
-            timestamp=datetime.utcnow().isoformat()
+            status=status
         )
 
 
 def setup_logging():
     """Setup structured logging for the application"""
     
-    # Configure structlog
+    # Processors shared by structlog events and foreign (stdlib) log records
+    shared_processors = [
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.UnicodeDecoder(),
+    ]
+    
+    # Configure structlog - rendering is deferred to the stdlib handler
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            *shared_processors,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
     
+    # Single renderer for every record
+    if settings.LOG_FORMAT == "json":
+        renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+    else:
+        renderer = structlog.dev.ConsoleRenderer(colors=False)
+    
+    formatter = structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=shared_processors,
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.format_exc_info,
+            renderer
+        ]
+    )
+    
     # Configure standard logging
     log_handler = logging.StreamHandler(sys.stdout)
-    
-    if settings.LOG_FORMAT == "json":
-        formatter = jsonlogger.JsonFormatter(
-            '%(timestamp)s %(level)s %(name)s %(message)s'
-        )
-        log_handler.setFormatter(formatter)
+    log_handler.setFormatter(formatter)
     
     logging.basicConfig(
         level=getattr(logging, settings.LOG_LEVEL),
@@ -3,11 +3,13 @@ Main FastAPI Application Entry Point
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager, suppress
+import asyncio
 
 from app.core.config import settings
 from app.core.logging import setup_logging, logger
-from app.core.database import init_db
+from app.core.database import init_db, warmup_db
 from app.modules.incidents.routes import router as incidents_router
 from app.modules.analytics.routes import router as analytics_router
 from app.modules.ai.routes import router as ai_router
@@ -24,6 +26,7 @@ async def lifespan(app: FastAPI):
     
     # Initialize database
     await init_db()
+    await warmup_db()
     logger.info("Database initialized successfully")
     
     # Seed database if enabled
@@ -37,13 +40,30 @@ async def lifespan(app: FastAPI):
             logger.error(f"Failed to seed database: {e}")
             # Don't fail startup if seeding fails
     
-    # AI models will be lazy-loaded on first use to avoid blocking startup
-    logger.info("Application ready - AI models will load on first request")
+    # Preload AI models if enabled, otherwise lazy-load on first use
+    if settings.PRELOAD_AI:
+        from app.modules.ai.service import get_ai_service
+        ai_service = await get_ai_service()
+        await asyncio.to_thread(ai_service.warmup)
+        logger.info("Application ready - AI models preloaded")
+    else:
+        logger.info("Application ready - AI models will load on first request")
+    
+    # Keep the analytics rollup fresh in the background
+    rollup_task = None
+    if settings.ANALYTICS_ROLLUP:
+        from app.modules.analytics.service import AnalyticsService
+        rollup_task = asyncio.create_task(AnalyticsService.run_rollup_refresher())
     
     yield
     
     # Shutdown
     logger.info("Shutting down application")
+    if rollup_task:
+        rollup_task.cancel()
+        # Let an in-flight refresh unwind before the process exits
+        with suppress(asyncio.CancelledError):
+            await rollup_task
 
 
 # Create FastAPI app
@@ -51,6 +71,7 @@ app = FastAPI(
     title="Waste Incident Reporting & AI Insight Platform",
     description="Enterprise-grade waste incident management system with offline AI capabilities",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -58,9 +79,11 @@ app = FastAPI(
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
+    allow_origin_regex=settings.CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=settings.CORS_MAX_AGE,
 )
 
 # Register routers
@@ -2,16 +2,18 @@
 AI API Routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
-from uuid import UUID
+from typing import Any, Iterable, Iterator
+import orjson
 
-from app.core.database import get_db
-from app.modules.ai.service import AIService
+from app.core.database import get_db_readonly
+from app.modules.ai.service import AIService, get_ai_service
 from app.modules.ai.schemas import (
     WasteClassificationRequest,
     WasteClassificationResponse,
     SimilarIncidentsRequest,
+    SimilarIncidentItem,
     SimilarIncidentsResponse,
     KeywordExtractionRequest,
     KeywordExtractionResponse
@@ -20,30 +22,39 @@ from app.core.logging import logger
 
 router = APIRouter()
 
+# Responses are validated once when the schema object is built and returned
+# as ORJSONResponse, so FastAPI skips re-validating them against response_model
+# (which is kept for the OpenAPI schema).
+
 
 @router.post(
     "/classify",
     response_model=WasteClassificationResponse,
     summary="Classify waste type from description"
 )
-async def classify_waste(request: WasteClassificationRequest):
+async def classify_waste(
+    request: WasteClassificationRequest,
+    ai_service: AIService = Depends(get_ai_service)
+):
     """
     Classify waste type using offline AI model.
     
     Uses rule-based classification with keyword matching.
     """
     try:
-        ai_service = AIService()
-        waste_type, confidence = ai_service.classify_waste_type(request.description)
+        waste_type, confidence = await ai_service.classify_waste_type_async(
+            request.description
+        )
         
-        return WasteClassificationResponse(
+        response = WasteClassificationResponse(
             waste_type=waste_type,
             confidence=confidence,
             description=request.description
         )
+        return ORJSONResponse(response.model_dump(mode="json"))
         
     except Exception as e:
-        logger.error(f"Error classifying waste: {str(e)}", exc_info=True)
+        logger.error("Error classifying waste", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to classify waste: {str(e)}"
@@ -55,26 +66,29 @@ async def classify_waste(request: WasteClassificationRequest):
     response_model=KeywordExtractionResponse,
     summary="Extract keywords from text"
 )
-async def extract_keywords(request: KeywordExtractionRequest):
+async def extract_keywords(
+    request: KeywordExtractionRequest,
+    ai_service: AIService = Depends(get_ai_service)
+):
     """
     Extract important keywords from incident description.
     
     Uses NLP tokenization and frequency analysis.
     """
     try:
-        ai_service = AIService()
         keywords = ai_service.extract_keywords(
             request.text,
             top_n=request.top_n
         )
         
-        return KeywordExtractionResponse(
+        response = KeywordExtractionResponse(
             keywords=keywords,
             text=request.text
         )
+        return ORJSONResponse(response.model_dump(mode="json"))
         
     except Exception as e:
-        logger.error(f"Error extracting keywords: {str(e)}", exc_info=True)
+        logger.error("Error extracting keywords", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to extract keywords: {str(e)}"
@@ -88,7 +102,8 @@ async def extract_keywords(request: KeywordExtractionRequest):
 )
 async def find_similar_incidents(
     request: SimilarIncidentsRequest,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_readonly),
+    ai_service: AIService = Depends(get_ai_service)
 ):
     """
     Find similar incidents using semantic similarity.
@@ -96,10 +111,8 @@ async def find_similar_incidents(
     Uses sentence transformers to generate embeddings and cosine similarity.
     """
     try:
-        ai_service = AIService()
-        
         # Generate embedding for the description
-        embedding = ai_service.generate_embedding(request.description)
+        embedding = await ai_service.generate_embedding(request.description)
         
         # Find similar incidents
         similar = await ai_service.find_similar_incidents(
@@ -110,23 +123,64 @@ async def find_similar_incidents(
             limit=request.limit
         )
         
-        return SimilarIncidentsResponse(
+        response = SimilarIncidentsResponse(
             incident_id=request.incident_id,
             similar_incidents=[
-                {
-                    "id": str(inc.id),
-                    "description": inc.description,
-                    "location": inc.location,
-                    "waste_type": inc.waste_type
-                }
-                for inc in similar
+                SimilarIncidentItem.model_validate(inc) for inc in similar
             ],
             count=len(similar)
         )
+        return ORJSONResponse(response.model_dump(mode="json"))
         
     except Exception as e:
-        logger.error(f"Error finding similar incidents: {str(e)}", exc_info=True)
+        logger.error("Error finding similar incidents", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to find similar incidents: {str(e)}"
         )
+
+
+def _ndjson_lines(incidents: Iterable[Any]) -> Iterator[bytes]:
+    """Serialize incidents one JSON object per line"""
+    for inc in incidents:
+        item = SimilarIncidentItem.model_validate(inc)
+        yield orjson.dumps(item.model_dump(mode="json")) + b"\n"
+
+
+@router.post(
+    "/similar-incidents/stream",
+    summary="Stream similar incidents as NDJSON"
+)
+async def stream_similar_incidents(
+    request: SimilarIncidentsRequest,
+    db: AsyncSession = Depends(get_db_readonly),
+    ai_service: AIService = Depends(get_ai_service)
+):
+    """
+    Find similar incidents and stream them as newline-delimited JSON.
+    
+    Each line is a SimilarIncidentItem, so clients can render results
+    incrementally without the server buffering the whole response.
+    """
+    try:
+        embedding = await ai_service.generate_embedding(request.description)
+        
+        similar = await ai_service.find_similar_incidents(
+            db,
+            request.incident_id,
+            embedding,
+            threshold=request.threshold,
+            limit=request.limit
+        )
+        
+        return StreamingResponse(
+            _ndjson_lines(similar),
+            media_type="application/x-ndjson"
+        )
+        
+    except Exception as e:
+        logger.error("Error streaming similar incidents", error=str(e), exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to stream similar incidents: {str(e)}"
+        )
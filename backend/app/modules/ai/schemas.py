@@ -1,7 +1,7 @@
 """
 AI Module Schemas
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from uuid import UUID
 
@@ -40,7 +40,9 @@ class SimilarIncidentsRequest(BaseModel):
 
 class SimilarIncidentItem(BaseModel):
     """Schema for a similar incident item"""
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: UUID
     description: str
     location: str
     waste_type: Optional[str] = None
@@ -2,27 +2,170 @@
 AI Service - Offline Machine Learning Features
 
 This service implements multiple AI features using only offline/local models:
-1. Waste Type Classification using TF-IDF and rule-based matching
+1. Waste Type Classification using category embeddings and keyword matching
 2. Semantic Similarity Detection using sentence-transformers
 3. Keyword Extraction using NLP
 4. Duplicate/Similar Incident Detection using vector embeddings
 """
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Callable, TYPE_CHECKING
 from uuid import UUID
+from pathlib import Path
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import ahocorasick
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+import os
 import re
+from collections import Counter
+from cachetools import LRUCache
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, text
 
 from app.core.config import settings
 from app.core.logging import logger
 
+# SIMD distance kernels for in-process int8 scoring; NumPy is the fallback
+try:
+    import simsimd
+except ImportError:  # pragma: no cover - optional dependency
+    simsimd = None
+
+# Heavy ML libraries (torch via sentence-transformers) are
+# imported inside the methods that need them so importing this module stays cheap
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+# Candidates requested from the HNSW index per result wanted, leaving room
+# for rows dropped by the similarity threshold and exclude_id
+HNSW_EF_SEARCH_FACTOR = 4
+
+# Keyword tokens: lowercase alphabetic runs of three or more letters
+_TOKEN_RE = re.compile(r"[a-z]{3,}")
+
+# English stopwords (NLTK's list), inlined so no corpus download is needed
+STOPWORDS = frozenset({
+    "i", "me", "my", "myself", "we", "our", "ours", "ourselves", "you",
+    "you're", "you've", "you'll", "you'd", "your", "yours", "yourself",
+    "yourselves", "he", "him", "his", "himself", "she", "she's", "her", "hers",
+    "herself", "it", "it's", "its", "itself", "they", "them", "their",
+    "theirs", "themselves", "what", "which", "who", "whom", "this", "that",
+    "that'll", "these", "those", "am", "is", "are", "was", "were", "be",
+    "been", "being", "have", "has", "had", "having", "do", "does", "did",
+    "doing", "a", "an", "the", "and", "but", "if", "or", "because", "as",
+    "until", "while", "of", "at", "by", "for", "with", "about", "against",
+    "between", "into", "through", "during", "before", "after", "above",
+    "below", "to", "from", "up", "down", "in", "out", "on", "off", "over",
+    "under", "again", "further", "then", "once", "here", "there", "when",
+    "where", "why", "how", "all", "any", "both", "each", "few", "more", "most",
+    "other", "some", "such", "no", "nor", "not", "only", "own", "same", "so",
+    "than", "too", "very", "s", "t", "can", "will", "just", "don", "don't",
+    "should", "should've", "now", "d", "ll", "m", "o", "re", "ve", "y", "ain",
+    "aren", "aren't", "couldn", "couldn't", "didn", "didn't", "doesn",
+    "doesn't", "hadn", "hadn't", "hasn", "hasn't", "haven", "haven't", "isn",
+    "isn't", "ma", "mightn", "mightn't", "mustn", "mustn't", "needn",
+    "needn't", "shan", "shan't", "shouldn", "shouldn't", "wasn", "wasn't",
+    "weren", "weren't", "won", "won't", "wouldn", "wouldn't"
+})
+
+
+def quantize_embedding(embedding: Any) -> Tuple[np.ndarray, float]:
+    """
+    Symmetric int8 quantization of an embedding vector
+    
+    Returns (int8 vector, scale) with embedding ≈ int8 vector * scale.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    scale = float(np.max(np.abs(vector))) / 127 if vector.size else 0.0
+    if scale == 0.0:
+        scale = 1.0
+    quantized = np.round(vector / scale).astype(np.int8)
+    return quantized, scale
+
+
+def top_k_indices(scores: np.ndarray, threshold: float, limit: int) -> np.ndarray:
+    """
+    Indices of the highest scores at or above threshold, best first
+    
+    Selects the top-k in O(N) with argpartition, then sorts only those k.
+    """
+    candidates = np.flatnonzero(scores >= threshold)
+    if candidates.size > limit:
+        partitioned = np.argpartition(-scores[candidates], limit - 1)[:limit]
+        candidates = candidates[partitioned]
+    return candidates[np.argsort(-scores[candidates])]
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent encode requests into a single batched forward pass
+    
+    Requests arriving within max_wait_ms of each other (up to max_batch_size)
+    are encoded together on a dedicated single-thread executor, keeping the
+    event loop free and never running two forward passes at once.
+    """
+    
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0
+    ):
+        self.encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
+    
+    def _ensure_worker(self):
+        """Start the drain task on the running loop if needed"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+    
+    async def submit(self, text: str) -> np.ndarray:
+        """Queue text for encoding and wait for its embedding"""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+    
+    async def _run(self):
+        """Drain the queue in micro-batches"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_wait
+            
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Identical texts in a batch are encoded once
+            texts = list(dict.fromkeys(text for text, _ in batch))
+            try:
+                embeddings = await self._loop.run_in_executor(
+                    self._executor, self.encode_fn, texts
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            by_text = dict(zip(texts, embeddings))
+            for text, future in batch:
+                if not future.done():
+                    future.set_result(by_text[text])
+
 
 class AIService:
     """
@@ -93,8 +236,18 @@ class AIService:
         ]
     }
     
+    # Keyword count per category, used to normalize keyword scores
+    CATEGORY_KEYWORD_COUNTS = {
+        category: len(keywords) for category, keywords in WASTE_CATEGORIES.items()
+    }
+    
+    # Results of pure text functions are memoized; very long texts are not cached
+    RESULT_CACHE_SIZE = 4096
+    MAX_CACHED_TEXT_LENGTH = 4096
+    
     _instance: Optional['AIService'] = None
     _initialized: bool = False
+    _init_lock = asyncio.Lock()  # Serializes first-time initialization
     
     def __new__(cls):
         if cls._instance is None:
@@ -103,61 +256,245 @@ class AIService:
     
     def __init__(self):
         if not hasattr(self, 'model'):
-            self.model: Optional[SentenceTransformer] = None
-            self.tfidf_vectorizer: Optional[TfidfVectorizer] = None
-            self.stopwords = set()
-            self.category_embeddings: Dict[str, np.ndarray] = {}
+            self.model: Optional["SentenceTransformer"] = None
+            self.autocast_dtype: Optional[Any] = None  # torch dtype for CPU autocast
+            self.stopwords = STOPWORDS
+            self.category_names: List[str] = []
+            self.category_matrix: Optional[np.ndarray] = None  # (categories, dim), L2-normalized
+            self.embedding_batcher = EmbeddingBatcher(
+                self._encode_batch,
+                max_batch_size=settings.EMBEDDING_MAX_BATCH,
+                max_wait_ms=settings.EMBEDDING_MAX_WAIT_MS
+            )
+            self.keyword_automaton = self._build_keyword_automaton()
+            self.category_automata = self._build_category_automata()
+            self.classification_cache = LRUCache(maxsize=self.RESULT_CACHE_SIZE)
+            self.keyword_cache = LRUCache(maxsize=self.RESULT_CACHE_SIZE)
+            self.embedding_cache = LRUCache(maxsize=self.RESULT_CACHE_SIZE)
         
     async def initialize(self):
-        """Initialize AI models and NLP resources"""
+        """
+        Initialize AI models and NLP resources
+        
+        Concurrent callers wait on a lock so models are loaded exactly once;
+        loading runs in a worker thread to keep the event loop responsive.
+        """
         if AIService._initialized:
             logger.debug("AI Service already initialized, skipping")
             return
-            
-        logger.info("Initializing AI Service")
         
-        try:
-            # Download NLTK data
-            try:
-                nltk.data.find('tokenizers/punkt')
-            except LookupError:
-                nltk.download('punkt', quiet=True)
-            
-            try:
-                nltk.data.find('corpora/stopwords')
-            except LookupError:
-                nltk.download('stopwords', quiet=True)
-            
-            self.stopwords = set(stopwords.words('english'))
+        async with AIService._init_lock:
+            if AIService._initialized:
+                return
             
+            logger.info("Initializing AI Service")
+            await asyncio.to_thread(self._load_resources)
+            AIService._initialized = True
+            logger.info("AI Service initialized successfully")
+    
+    def _load_resources(self):
+        """Load models and precomputed data (blocking)"""
+        try:
             # Initialize sentence transformer model (offline, pre-trained)
             logger.info(f"Loading sentence transformer model: {settings.AI_MODEL_NAME}")
-            self.model = SentenceTransformer(settings.AI_MODEL_NAME)
-            
-            # Initialize TF-IDF vectorizer
-            self.tfidf_vectorizer = TfidfVectorizer(
-                max_features=1000,
-                stop_words='english',
-                ngram_range=(1, 2)
-            )
+            self._configure_torch_threads()
+            self.model = self._load_model()
+            self._configure_inference_dtype()
             
             # Pre-compute embeddings for waste categories (for semantic classification)
             logger.info("Pre-computing waste category embeddings for semantic classification")
-            for category, description in self.WASTE_CATEGORY_DESCRIPTIONS.items():
-                self.category_embeddings[category] = self.model.encode(
-                    description, 
-                    convert_to_numpy=True
-                )
-            logger.info(f"Pre-computed embeddings for {len(self.category_embeddings)} waste categories")
-            
-            AIService._initialized = True
-            logger.info("AI Service initialized successfully")
+            self.category_names = list(self.WASTE_CATEGORY_DESCRIPTIONS.keys())
+            self.category_matrix = self._load_category_matrix()
+            logger.info(f"Pre-computed embeddings for {len(self.category_names)} waste categories")
             
         except Exception as e:
             logger.error(f"Failed to initialize AI Service: {str(e)}", exc_info=True)
             raise
     
-    def classify_waste_type(self, description: str) -> Tuple[str, float]:
+    def _configure_torch_threads(self):
+        """
+        Split CPU cores between worker processes so encodes don't oversubscribe
+        """
+        import torch
+        
+        threads = max(1, (os.cpu_count() or 1) // max(1, settings.WEB_CONCURRENCY))
+        torch.set_num_threads(threads)
+        logger.info(f"Torch intra-op threads: {threads}")
+    
+    def _load_model(self) -> "SentenceTransformer":
+        """
+        Load the sentence transformer for the configured backend
+        
+        With AI_BACKEND=onnx the model is exported once to an int8 dynamically
+        quantized ONNX file under CACHE_DIR and served by ONNX Runtime; any
+        export/load failure falls back to the PyTorch model.
+        """
+        from sentence_transformers import SentenceTransformer
+        
+        if settings.AI_BACKEND != "onnx":
+            return SentenceTransformer(settings.AI_MODEL_NAME)
+        
+        try:
+            from sentence_transformers import export_dynamic_quantized_onnx_model
+            
+            export_dir = Path(settings.CACHE_DIR) / ("onnx-" + settings.AI_MODEL_NAME.replace("/", "_"))
+            file_name = f"onnx/model_qint8_{settings.ONNX_QUANTIZATION}.onnx"
+            
+            if not (export_dir / file_name).exists():
+                logger.info(f"Exporting quantized ONNX model to {export_dir}")
+                onnx_model = SentenceTransformer(settings.AI_MODEL_NAME, backend="onnx")
+                onnx_model.save_pretrained(str(export_dir))
+                export_dynamic_quantized_onnx_model(
+                    onnx_model, settings.ONNX_QUANTIZATION, str(export_dir)
+                )
+            
+            return SentenceTransformer(
+                str(export_dir),
+                backend="onnx",
+                model_kwargs={"file_name": file_name}
+            )
+        
+        except Exception as e:
+            logger.warning(f"ONNX backend unavailable, using PyTorch: {e}")
+            return SentenceTransformer(settings.AI_MODEL_NAME)
+    
+    def _configure_inference_dtype(self):
+        """
+        Apply settings.AI_DTYPE to the loaded model
+        
+        float16 halves the weights on CUDA; bfloat16 runs encodes under CPU
+        autocast. Anything else, or float16 without a GPU, stays float32.
+        """
+        dtype = settings.AI_DTYPE
+        if dtype != "float32" and getattr(self.model, "backend", "torch") != "torch":
+            logger.warning(f"AI_DTYPE={dtype} only applies to the PyTorch backend, ignoring")
+            return
+        
+        import torch
+        
+        if dtype == "float16":
+            if torch.cuda.is_available():
+                self.model = self.model.half()
+            else:
+                logger.warning("AI_DTYPE=float16 requires CUDA, using float32")
+                dtype = "float32"
+        elif dtype == "bfloat16":
+            self.autocast_dtype = torch.bfloat16
+        elif dtype != "float32":
+            logger.warning(f"Unknown AI_DTYPE {dtype!r}, using float32")
+            dtype = "float32"
+        
+        logger.info(f"Sentence transformer inference dtype: {dtype}")
+    
+    def _model_encode(self, texts: Any, **kwargs) -> np.ndarray:
+        """
+        Run model.encode at the configured precision (blocking)
+        
+        Results are always float32 so downstream NumPy math stays stable.
+        """
+        if self.autocast_dtype is None:
+            embeddings = self.model.encode(texts, convert_to_numpy=True, **kwargs)
+            return embeddings.astype(np.float32, copy=False)
+        
+        import torch
+        
+        with torch.autocast("cpu", dtype=self.autocast_dtype):
+            embeddings = self.model.encode(texts, convert_to_tensor=True, **kwargs)
+        return embeddings.float().cpu().numpy()
+    
+    def _load_category_matrix(self) -> np.ndarray:
+        """
+        Build the L2-normalized (categories, dim) matrix of category embeddings
+        
+        All descriptions are encoded in one batch; the result is cached on disk,
+        keyed by model name and category definitions, so warm starts skip encoding.
+        """
+        key_source = (
+            f"{settings.AI_MODEL_NAME}|{settings.AI_BACKEND}|"
+            f"{settings.ONNX_QUANTIZATION}|{settings.AI_DTYPE}|"
+        ) + "|".join(
+            f"{category}={description}"
+            for category, description in self.WASTE_CATEGORY_DESCRIPTIONS.items()
+        )
+        key = hashlib.sha1(key_source.encode()).hexdigest()
+        cache_path = Path(settings.CACHE_DIR) / f"cat_emb_{key}.npy"
+        
+        if cache_path.exists():
+            try:
+                logger.info(f"Loading cached category embeddings from {cache_path}")
+                return np.load(cache_path, mmap_mode="r")
+            except Exception as e:
+                logger.warning(f"Could not load cached category embeddings: {e}")
+        
+        matrix = self._model_encode(
+            list(self.WASTE_CATEGORY_DESCRIPTIONS.values()),
+            batch_size=len(self.WASTE_CATEGORY_DESCRIPTIONS),
+            normalize_embeddings=True
+        )
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(cache_path, matrix)
+        except Exception as e:
+            logger.warning(f"Could not cache category embeddings: {e}")
+        
+        return matrix
+    
+    def warmup(self):
+        """
+        Run a dummy encode so model weights are materialized before traffic
+        """
+        self._encode_batch(["warmup"])
+        logger.info("AI Service warmed up")
+    
+    def classify_waste_type(
+        self,
+        description: str,
+        description_embedding: Optional[np.ndarray] = None
+    ) -> Tuple[str, float]:
+        """
+        Classify waste type, memoized on the description text
+        
+        A precomputed description embedding may be passed to skip encoding.
+        
+        Returns: (waste_type, confidence_score)
+        """
+        cacheable = len(description) < self.MAX_CACHED_TEXT_LENGTH
+        if cacheable:
+            cached = self.classification_cache.get(description)
+            if cached is not None:
+                return cached
+        
+        result = self._classify_waste_type(description, description_embedding)
+        
+        if cacheable:
+            self.classification_cache[description] = result
+        return result
+    
+    async def classify_waste_type_async(self, description: str) -> Tuple[str, float]:
+        """
+        Classify waste type without blocking the event loop
+        
+        The description is encoded off-loop through the micro-batcher;
+        cached classifications skip encoding entirely.
+        
+        Returns: (waste_type, confidence_score)
+        """
+        if not self.model:
+            raise RuntimeError("AI Service not initialized")
+        
+        cached = self.classification_cache.get(description)
+        if cached is not None:
+            return cached
+        
+        description_embedding = await self._encode(description)
+        return self.classify_waste_type(description, description_embedding)
+    
+    def _classify_waste_type(
+        self,
+        description: str,
+        description_embedding: Optional[np.ndarray] = None
+    ) -> Tuple[str, float]:
         """
         Classify waste type using hybrid AI approach:
         1. Primary: Semantic similarity with category embeddings (AI-powered)
@@ -165,52 +502,38 @@ class AIService:
         
         Returns: (waste_type, confidence_score)
         """
-        if not self.model or not self.category_embeddings:
+        if not self.model or self.category_matrix is None:
             raise RuntimeError("AI Service not initialized")
         
         try:
             # Stage 1: Semantic Classification (AI-powered)
             # Generate embedding for the incident description
-            description_embedding = self.model.encode(description, convert_to_numpy=True)
+            if description_embedding is None:
+                description_embedding = self._model_encode(
+                    description, normalize_embeddings=True
+                )
             
-            # Calculate cosine similarity with each waste category
-            semantic_scores = {}
-            for category, category_embedding in self.category_embeddings.items():
-                similarity = cosine_similarity(
-                    description_embedding.reshape(1, -1),
-                    category_embedding.reshape(1, -1)
-                )[0][0]
-                semantic_scores[category] = float(similarity)
+            # Embeddings are unit-length, so cosine similarity with every
+            # waste category is one matrix-vector product
+            semantic_scores = self.category_matrix @ description_embedding
             
             # Get best semantic match
-            best_semantic_category = max(semantic_scores.items(), key=lambda x: x[1])
-            semantic_category = best_semantic_category[0]
-            semantic_confidence = best_semantic_category[1]
+            best_index = int(semantic_scores.argmax())
+            semantic_category = self.category_names[best_index]
+            semantic_confidence = float(semantic_scores[best_index])
             
             # Stage 2: Keyword Matching (Fallback/Booster)
             description_lower = description.lower()
-            keyword_scores = {}
-            
-            for category, keywords in self.WASTE_CATEGORIES.items():
-                score = 0
-                matches = 0
-                
-                for keyword in keywords:
-                    if keyword in description_lower:
-                        matches += 1
-                        # Weight longer keywords more heavily
-                        score += len(keyword.split())
-                
-                if matches > 0:
-                    # Normalize score
-                    keyword_scores[category] = score / len(keywords)
             
             # Decision Logic: Combine semantic and keyword approaches
             
             # Case 1: High semantic confidence (>= 0.50) - trust AI
             if semantic_confidence >= 0.50:
-                # If keywords also match, boost confidence
-                keyword_boost = keyword_scores.get(semantic_category, 0) * 0.2
+                # If keywords also match, boost confidence; only the semantic
+                # category's keywords matter here, so skip the full scan
+                keyword_boost = self._category_keyword_score(
+                    description_lower, semantic_category
+                ) * 0.2
                 final_confidence = min(semantic_confidence + keyword_boost, 1.0)
                 
                 logger.debug(
@@ -223,11 +546,12 @@ class AIService:
                 
                 return semantic_category, round(final_confidence, 2)
             
+            keyword_scores = self._keyword_scores(description_lower)
+            
             # Case 2: Low semantic confidence but strong keyword match - use keywords
             if keyword_scores:
-                best_keyword_match = max(keyword_scores.items(), key=lambda x: x[1])
-                keyword_category = best_keyword_match[0]
-                keyword_confidence = min(best_keyword_match[1] * 2, 1.0)
+                keyword_category = max(keyword_scores, key=keyword_scores.get)
+                keyword_confidence = min(keyword_scores[keyword_category] * 2, 1.0)
                 
                 # If semantic also weakly agrees, boost confidence
                 if semantic_category == keyword_category:
@@ -260,86 +584,179 @@ class AIService:
             # Fallback to keyword-only classification
             return self._classify_by_keywords_only(description)
     
+    @classmethod
+    def _build_keyword_automaton(cls) -> "ahocorasick.Automaton":
+        """
+        Compile every fallback keyword into one Aho-Corasick automaton
+        
+        Each keyword maps to (keyword, weight, categories): the weight (word
+        count) is computed once here, and categories is a tuple since some
+        keywords (e.g. "battery", "bottle") belong to more than one category.
+        """
+        keyword_categories: Dict[str, List[str]] = {}
+        for category, keywords in cls.WASTE_CATEGORIES.items():
+            for keyword in keywords:
+                keyword_categories.setdefault(keyword, []).append(category)
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, categories in keyword_categories.items():
+            weight = keyword.count(" ") + 1
+            automaton.add_word(keyword, (keyword, weight, tuple(categories)))
+        automaton.make_automaton()
+        return automaton
+    
+    @classmethod
+    def _build_category_automata(cls) -> Dict[str, "ahocorasick.Automaton"]:
+        """
+        One small automaton per category, mapping keyword -> (keyword, weight)
+        """
+        automata = {}
+        for category, keywords in cls.WASTE_CATEGORIES.items():
+            automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                automaton.add_word(keyword, (keyword, keyword.count(" ") + 1))
+            automaton.make_automaton()
+            automata[category] = automaton
+        return automata
+    
+    def _category_keyword_score(self, description_lower: str, category: str) -> float:
+        """
+        Keyword score for a single category, as _keyword_scores would report it
+        """
+        automaton = self.category_automata.get(category)
+        if automaton is None:
+            return 0.0
+        
+        matched = {value for _, value in automaton.iter(description_lower)}
+        return sum(weight for _, weight in matched) / self.CATEGORY_KEYWORD_COUNTS[category]
+    
+    def _keyword_scores(self, description_lower: str) -> Dict[str, float]:
+        """
+        Score categories by keyword matches found in a single automaton pass
+        
+        Substring semantics match `keyword in description_lower`: each keyword
+        counts once, longer keywords weigh more, and scores are normalized by
+        the category's keyword count.
+        """
+        matched = {value for _, value in self.keyword_automaton.iter(description_lower)}
+        
+        raw_scores: Dict[str, int] = {}
+        for _, weight, categories in matched:
+            for category in categories:
+                raw_scores[category] = raw_scores.get(category, 0) + weight
+        
+        # Keep WASTE_CATEGORIES order so max() tie-breaking is unchanged
+        return {
+            category: raw_scores[category] / keyword_count
+            for category, keyword_count in self.CATEGORY_KEYWORD_COUNTS.items()
+            if category in raw_scores
+        }
+    
     def _classify_by_keywords_only(self, description: str) -> Tuple[str, float]:
         """
         Fallback method: Classify using only keyword matching
         Used when semantic classification fails
         """
-        description_lower = description.lower()
-        
-        scores = {}
-        for category, keywords in self.WASTE_CATEGORIES.items():
-            score = 0
-            matches = 0
-            
-            for keyword in keywords:
-                if keyword in description_lower:
-                    matches += 1
-                    score += len(keyword.split())
-            
-            if matches > 0:
-                scores[category] = score / len(keywords)
+        scores = self._keyword_scores(description.lower())
         
         if not scores:
             return "unclassified", 0.0
         
-        best_category = max(scores.items(), key=lambda x: x[1])
-        max_score = best_category[1]
-        confidence = min(max_score * 2, 1.0)
+        best_category = max(scores, key=scores.get)
+        confidence = min(scores[best_category] * 2, 1.0)
         
         logger.warning(
             "Using fallback keyword classification",
-            category=best_category[0],
+            category=best_category,
             confidence=round(confidence, 2)
         )
         
-        return best_category[0], round(confidence, 2)
+        return best_category, round(confidence, 2)
     
     def extract_keywords(self, description: str, top_n: int = 5) -> List[str]:
+        """
+        Extract important keywords, memoized on (description, top_n)
+        """
+        cacheable = len(description) < self.MAX_CACHED_TEXT_LENGTH
+        key = (description, top_n)
+        if cacheable:
+            cached = self.keyword_cache.get(key)
+            if cached is not None:
+                return list(cached)
+        
+        keywords = self._extract_keywords(description, top_n)
+        
+        if cacheable:
+            self.keyword_cache[key] = tuple(keywords)
+        return keywords
+    
+    def _extract_keywords(self, description: str, top_n: int = 5) -> List[str]:
         """
         Extract important keywords from description using NLP
         """
         try:
-            # Tokenize and clean
-            tokens = word_tokenize(description.lower())
+            # Tokenize into alphabetic words and drop stopwords
+            tokens = _TOKEN_RE.findall(description.lower())
+            keywords = [word for word in tokens if word not in self.stopwords]
             
-            # Remove stopwords and non-alphabetic tokens
-            keywords = [
-                word for word in tokens 
-                if word.isalpha() 
-                and word not in self.stopwords 
-                and len(word) > 2
-            ]
-            
-            # Get frequency
-            word_freq = {}
-            for word in keywords:
-                word_freq[word] = word_freq.get(word, 0) + 1
-            
-            # Sort by frequency and return top N
-            sorted_keywords = sorted(
-                word_freq.items(), 
-                key=lambda x: x[1], 
-                reverse=True
-            )
-            
-            return [word for word, freq in sorted_keywords[:top_n]]
+            # Most frequent first; ties keep first-seen order
+            return [word for word, _ in Counter(keywords).most_common(top_n)]
             
         except Exception as e:
             logger.error(f"Error extracting keywords: {str(e)}")
             return []
     
-    def generate_embedding(self, text: str) -> List[float]:
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Encode a batch of texts into L2-normalized vectors in one forward pass (blocking)"""
+        return self._model_encode(texts, batch_size=32, normalize_embeddings=True)
+    
+    async def _encode(self, text: str) -> np.ndarray:
+        """
+        Encode text via the micro-batcher, memoized on the text
+        
+        Cached arrays are read-only since they are shared between callers.
+        """
+        cacheable = len(text) < self.MAX_CACHED_TEXT_LENGTH
+        if cacheable:
+            cached = self.embedding_cache.get(text)
+            if cached is not None:
+                return cached
+        
+        embedding = await self.embedding_batcher.submit(text)
+        
+        if cacheable:
+            # The batcher hands out row views of the batch matrix; copy so a
+            # cached row doesn't keep the whole batch alive
+            embedding = embedding.copy()
+            embedding.setflags(write=False)
+            self.embedding_cache[text] = embedding
+        return embedding
+    
+    def _canonical_text(self, text: str) -> str:
+        """
+        Text as the tokenizer sees it: whitespace collapsed, and lowercased
+        when the tokenizer is uncased (the embedding is unchanged either way)
+        """
+        text = " ".join(text.split())
+        tokenizer = getattr(self.model, "tokenizer", None)
+        if getattr(tokenizer, "do_lower_case", False):
+            text = text.lower()
+        return text
+    
+    async def generate_embedding(self, text: str) -> np.ndarray:
         """
         Generate semantic embedding vector for text using sentence-transformers
+        
+        Returns a read-only, L2-normalized float32 array. Encoding runs off the
+        event loop and is micro-batched with concurrent callers. Text is
+        canonicalized first so repeated queries that differ only in case or
+        spacing hit the embedding cache.
         """
         if not self.model:
             raise RuntimeError("AI Service not initialized")
         
         try:
-            # Generate embedding
-            embedding = self.model.encode(text, convert_to_numpy=True)
-            return embedding.tolist()
+            return await self._encode(self._canonical_text(text))
             
         except Exception as e:
             logger.error(f"Error generating embedding: {str(e)}")
@@ -352,24 +769,29 @@ class AIService:
     ) -> Dict[str, Any]:
         """
         Process incident with all AI features
-        Returns dict with waste_type, confidence, embedding, keywords
+        Returns dict with waste_type, confidence, embedding (float32 ndarray), keywords
         """
+        if not self.model:
+            raise RuntimeError("AI Service not initialized")
+        
         try:
-            # Classify waste type
-            waste_type, confidence = self.classify_waste_type(description)
+            combined_text = f"{description} {location}"
+            
+            # Classify and encode the combined text (for similarity search)
+            # concurrently so both encodes land in the same micro-batch
+            (waste_type, confidence), combined_embedding = await asyncio.gather(
+                self.classify_waste_type_async(description),
+                self._encode(combined_text)
+            )
             
             # Extract keywords
             keywords = self.extract_keywords(description)
             
-            # Generate embedding for similarity search
-            combined_text = f"{description} {location}"
-            embedding = self.generate_embedding(combined_text)
-            
             result = {
                 "waste_type": waste_type,
                 "confidence": confidence,
                 "keywords": keywords,
-                "embedding": embedding
+                "embedding": combined_embedding
             }
             
             logger.info(
@@ -389,47 +811,21 @@ class AIService:
         self,
         db: AsyncSession,
         current_incident_id: UUID,
-        embedding: List[float],
+        embedding: np.ndarray,
         threshold: float = None,
         limit: int = 5
     ) -> List[Any]:
         """
-        Find similar incidents using vector similarity search
+        Find incidents similar to the given one (errors are logged, not raised)
         """
         if threshold is None:
             threshold = settings.SIMILARITY_THRESHOLD
         
         try:
-            from app.modules.incidents.models import Incident
-            
-            # Get all incidents with embeddings (excluding current)
-            query = select(Incident).where(
-                Incident.id != current_incident_id,
-                Incident.embedding.isnot(None)
+            similar_incidents = await self.search_incidents(
+                db, embedding, threshold, limit, exclude_id=current_incident_id
             )
             
-            result = await db.execute(query)
-            all_incidents = result.scalars().all()
-            
-            if not all_incidents:
-                return []
-            
-            # Calculate cosine similarity
-            current_embedding = np.array(embedding).reshape(1, -1)
-            similarities = []
-            
-            for incident in all_incidents:
-                if incident.embedding is not None and len(incident.embedding) > 0:
-                    incident_embedding = np.array(incident.embedding).reshape(1, -1)
-                    similarity = cosine_similarity(current_embedding, incident_embedding)[0][0]
-                    
-                    if similarity >= threshold:
-                        similarities.append((incident, float(similarity)))
-            
-            # Sort by similarity (descending) and return top N
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            similar_incidents = [inc for inc, sim in similarities[:limit]]
-            
             logger.info(
                 "Similar incidents found",
                 count=len(similar_incidents),
@@ -441,3 +837,117 @@ class AIService:
         except Exception as e:
             logger.error(f"Error finding similar incidents: {str(e)}", exc_info=True)
             return []
+    
+    async def search_incidents(
+        self,
+        db: AsyncSession,
+        embedding: np.ndarray,
+        threshold: float,
+        limit: int,
+        exclude_id: Optional[UUID] = None
+    ) -> List[Any]:
+        """
+        Incidents with cosine similarity >= threshold to embedding, best first
+        
+        Uses pgvector inner-product search, or in-process int8 scoring when
+        SIMILARITY_INT8 is enabled.
+        """
+        if settings.SIMILARITY_INT8:
+            return await self._search_incidents_int8(db, embedding, threshold, limit, exclude_id)
+        
+        from app.modules.incidents.models import Incident
+        
+        # The HNSW scan returns at most hnsw.ef_search candidates before the
+        # threshold and exclude_id filters apply; widen it so large limits
+        # and near-threshold matches aren't cut short (SET takes no bind params)
+        ef_search = max(limit * HNSW_EF_SEARCH_FACTOR, 40)
+        await db.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+        
+        # Rank inside PostgreSQL (served by the HNSW index) so only the top
+        # matches cross the wire. Embeddings are unit-length, so cosine
+        # similarity is the inner product; pgvector's <#> returns it negated.
+        negative_similarity = Incident.embedding.max_inner_product(embedding)
+        query = (
+            select(Incident)
+            .where(
+                Incident.embedding.isnot(None),
+                negative_similarity <= -threshold
+            )
+            .order_by(negative_similarity)
+            .limit(limit)
+        )
+        if exclude_id is not None:
+            query = query.where(Incident.id != exclude_id)
+        
+        result = await db.execute(query)
+        return list(result.scalars().all())
+    
+    async def _search_incidents_int8(
+        self,
+        db: AsyncSession,
+        embedding: np.ndarray,
+        threshold: float,
+        limit: int,
+        exclude_id: Optional[UUID] = None
+    ) -> List[Any]:
+        """
+        Search incidents by scoring int8-quantized embeddings in-process
+        
+        Quantization doesn't preserve unit length, so scores are not plain
+        int8 dot products: SimSIMD's cosine kernel normalizes in-register
+        when installed; otherwise the integer dot products are dequantized
+        with the stored per-vector scales, which recovers the inner product
+        (= cosine) of the unit-length originals without computing norms.
+        """
+        from app.modules.incidents.models import Incident
+        
+        query, query_scale = quantize_embedding(embedding)
+        
+        candidates = select(Incident.id, Incident.embedding_i8, Incident.embedding_scale).where(
+            Incident.embedding_i8.isnot(None),
+            Incident.embedding_scale.isnot(None),
+            # Skip rows whose vector size doesn't match the query
+            func.octet_length(Incident.embedding_i8) == query.size
+        )
+        if exclude_id is not None:
+            candidates = candidates.where(Incident.id != exclude_id)
+        
+        result = await db.execute(candidates)
+        rows = result.all()
+        
+        if not rows:
+            return []
+        
+        incident_ids = [row[0] for row in rows]
+        matrix = np.frombuffer(
+            b"".join(row[1] for row in rows), dtype=np.int8
+        ).reshape(len(rows), -1)
+        
+        if simsimd is not None:
+            distances = simsimd.cdist(query[np.newaxis, :], matrix, metric="cosine")
+            scores = 1.0 - np.asarray(distances, dtype=np.float32).ravel()
+        else:
+            scales = np.array([row[2] for row in rows], dtype=np.float32) * query_scale
+            scores = (matrix.astype(np.int32) @ query.astype(np.int32)) * scales
+        
+        top_ids = [incident_ids[i] for i in top_k_indices(scores, threshold, limit)]
+        
+        if not top_ids:
+            return []
+        
+        # Fetch full rows only for the winners, preserving rank order
+        result = await db.execute(select(Incident).where(Incident.id.in_(top_ids)))
+        by_id = {incident.id: incident for incident in result.scalars().all()}
+        return [by_id[i] for i in top_ids if i in by_id]
+
+
+async def get_ai_service() -> AIService:
+    """
+    Dependency returning the process-wide AIService, initialized
+    
+    Models load once on first use (or at startup with PRELOAD_AI); later
+    calls only check the initialized flag.
+    """
+    ai_service = AIService()
+    await ai_service.initialize()
+    return ai_service
@@ -0,0 +1,16 @@
+"""
+Analytics Database Objects
+"""
+from sqlalchemy import Date, Integer, String
+from sqlalchemy.sql import column, table
+
+# Per-day incident counts by waste type and location, maintained as a
+# materialized view (created in init_db, refreshed in the background).
+# Declared as a lightweight table construct so create_all never touches it.
+incidents_daily_rollup = table(
+    "incidents_daily_rollup",
+    column("day", Date),
+    column("waste_type", String),
+    column("location", String),
+    column("count", Integer),
+)
@@ -126,18 +126,21 @@ async def get_waste_type_trends(
 async def get_heatmap_data(
     start_date: Optional[datetime] = Query(None, description="Start date for filtering"),
     end_date: Optional[datetime] = Query(None, description="End date for filtering"),
+    cell_size: Optional[float] = Query(None, gt=0, le=10, description="Grid cell size in degrees (omit for exact coordinates)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get location-based data for heatmap visualization.
     
-    Returns incidents with coordinates grouped by location.
+    Returns incidents with coordinates grouped by location, or by grid
+    cell when cell_size is given (coarser cells for lower zoom levels).
     """
     try:
         data = await AnalyticsService.get_location_heatmap_data(
             db,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            cell_size=cell_size
         )
         
         return HeatmapResponse(
@@ -160,17 +163,20 @@ async def get_heatmap_data(
 )
 async def detect_anomalies(
     threshold_multiplier: float = Query(2.0, ge=1.0, le=5.0, description="Threshold multiplier"),
+    z_threshold: Optional[float] = Query(None, ge=0.5, le=5.0, description="Z-score threshold (overrides the multiplier)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Detect anomalies - locations with unusually high incident counts.
     
-    Uses statistical analysis to identify outliers.
+    Uses statistical analysis to identify outliers: a multiple of the mean
+    count, or a z-score against the standard deviation when z_threshold is set.
     """
     try:
         anomalies = await AnalyticsService.detect_anomalies(
             db,
-            threshold_multiplier=threshold_multiplier
+            threshold_multiplier=threshold_multiplier,
+            z_threshold=z_threshold
         )
         
         return AnomalyResponse(
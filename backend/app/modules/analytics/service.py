@@ -2,19 +2,227 @@
 Analytics Service - Dashboard Data and Insights
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, desc
-from typing import Dict, Any, List, Optional
+from sqlalchemy import (
+    select, func, and_, or_, desc, literal_column, text, cast, bindparam,
+    BigInteger, DateTime, Float, Integer
+)
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable, TypeVar, NamedTuple
 from datetime import datetime, timedelta
-from collections import Counter
+from cachetools import TTLCache
+import asyncio
+import functools
+from operator import itemgetter
 
-from app.modules.incidents.models import Incident
+from app.modules.incidents.models import Incident, IncidentKeyword
+from app.modules.analytics.models import incidents_daily_rollup
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.core.logging import logger
 
+T = TypeVar("T")
+
+# Rows fetched per round trip when streaming large result sets
+STREAM_BATCH_SIZE = 1000
+
+# Short-lived results of the heavier dashboard analyses, keyed on call arguments
+_result_cache: TTLCache = TTLCache(maxsize=256, ttl=max(settings.ANALYTICS_CACHE_TTL, 1))
+# Per-key locks expire like the results, so new minute-rounded keys don't
+# accumulate forever; an evicted lock at worst allows one duplicate computation
+_result_locks: TTLCache = TTLCache(maxsize=256, ttl=max(settings.ANALYTICS_CACHE_TTL, 1))
+# Bumped by every invalidation; results computed across a bump are not cached
+_cache_generation = 0
+
+
+def _cache_key_part(value: Any) -> Any:
+    """Datetimes are keyed to the minute so 'now'-relative windows can hit"""
+    if isinstance(value, datetime):
+        return value.replace(second=0, microsecond=0)
+    return value
+
+
+def _ttl_cached(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Reuse an analytics coroutine's result for ANALYTICS_CACHE_TTL seconds
+    
+    The key is every argument except the session, with datetimes rounded
+    down to the minute. A result is only stored if no invalidation happened
+    while it was computed. Concurrent misses for the same key wait on one
+    computation instead of all hitting the database. Cached dicts are
+    shared, so callers must not mutate them.
+    """
+    @functools.wraps(fn)
+    async def wrapper(db: AsyncSession, *args: Any, **kwargs: Any) -> T:
+        if settings.ANALYTICS_CACHE_TTL <= 0:
+            return await fn(db, *args, **kwargs)
+        
+        key = (
+            fn.__name__,
+            tuple(_cache_key_part(arg) for arg in args),
+            tuple(sorted((name, _cache_key_part(arg)) for name, arg in kwargs.items()))
+        )
+        cached = _result_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        async with _result_locks.setdefault(key, asyncio.Lock()):
+            cached = _result_cache.get(key)
+            if cached is not None:
+                return cached
+            
+            generation = _cache_generation
+            result = await fn(db, *args, **kwargs)
+            # A write committed meanwhile may not be reflected in this result
+            if generation == _cache_generation:
+                _result_cache[key] = result
+            return result
+    
+    return wrapper
+
+
+# Fixed-shape statements built once, so each call skips construction and
+# cache-key generation; per-call values are supplied as bind parameters
+
+# Per-location counts with the overall mean and population standard deviation
+# attached by window functions, so the anomaly threshold is applied in a single query
+_location_counts = (
+    select(
+        Incident.location,
+        func.count(Incident.id).label('count')
+    )
+    .group_by(Incident.location)
+    .cte('location_counts')
+)
+_location_with_mean = select(
+    _location_counts.c.location,
+    _location_counts.c.count,
+    func.avg(_location_counts.c.count).over().label('mean'),
+    func.stddev_pop(_location_counts.c.count).over().label('std_dev')
+).subquery()
+_location_anomaly_columns = select(
+    _location_with_mean.c.location,
+    _location_with_mean.c.count,
+    _location_with_mean.c.mean,
+    _location_with_mean.c.std_dev
+).order_by(desc(_location_with_mean.c.count))
+_LOCATION_ANOMALY_STMT = _location_anomaly_columns.where(
+    _location_with_mean.c.count
+    > _location_with_mean.c.mean * bindparam('threshold_multiplier', type_=Float)
+)
+_LOCATION_ZSCORE_STMT = _location_anomaly_columns.where(
+    _location_with_mean.c.count
+    > _location_with_mean.c.mean
+    + bindparam('z_threshold', type_=Float) * _location_with_mean.c.std_dev
+)
+
+# Keywords are counted from the normalized incident_keywords table, grouped
+# over its keyword index, so only the top rows are returned
+_KEYWORD_FREQUENCY_STMT = (
+    select(IncidentKeyword.keyword, func.count().label('count'))
+    .group_by(IncidentKeyword.keyword)
+    .order_by(desc('count'), IncidentKeyword.keyword)
+    .limit(bindparam('limit', type_=Integer))
+)
+
+
+class _DailyColumns(NamedTuple):
+    """Column expressions for per-day aggregates over incidents or the rollup"""
+    day: Any
+    waste_type: Any
+    time: Any
+    from_rollup: bool
+    
+    def bound(self, moment: datetime) -> Any:
+        """A time bound comparable to `time` (a date on the day-granular rollup)"""
+        return moment.date() if self.from_rollup else moment
+    
+    def count(self, where: Any = None) -> Any:
+        """Incident count aggregate, optionally filtered"""
+        if not self.from_rollup:
+            aggregate = func.count(Incident.id)
+            return aggregate if where is None else aggregate.filter(where)
+        
+        aggregate = func.sum(incidents_daily_rollup.c.count)
+        if where is not None:
+            aggregate = aggregate.filter(where)
+        return cast(func.coalesce(aggregate, 0), BigInteger)
+
 
 class AnalyticsService:
     """Service for generating analytics and dashboard data"""
     
+    # Set by incident writes, cleared when the rollup is refreshed
+    _rollup_stale: bool = True
+    
+    @staticmethod
+    def invalidate_cache():
+        """Drop cached analytics results (called after incident writes commit)"""
+        global _cache_generation
+        _cache_generation += 1
+        _result_cache.clear()
+        AnalyticsService._rollup_stale = True
+    
+    @staticmethod
+    def _daily_columns() -> _DailyColumns:
+        """
+        Source for per-day aggregates
+        
+        With ANALYTICS_ROLLUP the incidents_daily_rollup view is read instead
+        of incidents; it has day granularity and lags writes by up to
+        ROLLUP_REFRESH_SECONDS.
+        """
+        if settings.ANALYTICS_ROLLUP:
+            rollup = incidents_daily_rollup.c
+            return _DailyColumns(rollup.day, rollup.waste_type, rollup.day, True)
+        return _DailyColumns(
+            func.date(Incident.timestamp), Incident.waste_type, Incident.timestamp, False
+        )
+    
+    @staticmethod
+    async def refresh_rollup():
+        """Refresh the daily rollup without blocking readers"""
+        async with AsyncSessionLocal() as session:
+            await session.execute(text("SET LOCAL statement_timeout = 0"))
+            await session.execute(
+                text("REFRESH MATERIALIZED VIEW CONCURRENTLY incidents_daily_rollup")
+            )
+            await session.commit()
+    
+    @staticmethod
+    async def run_rollup_refresher():
+        """
+        Background loop refreshing the rollup every ROLLUP_REFRESH_SECONDS
+        when incidents have changed since the last refresh
+        """
+        while True:
+            await asyncio.sleep(settings.ROLLUP_REFRESH_SECONDS)
+            if not AnalyticsService._rollup_stale:
+                continue
+            
+            AnalyticsService._rollup_stale = False
+            try:
+                await AnalyticsService.refresh_rollup()
+                logger.debug("Daily analytics rollup refreshed")
+            except Exception as e:
+                AnalyticsService._rollup_stale = True
+                logger.warning(f"Could not refresh daily analytics rollup: {e}")
+    
     @staticmethod
+    async def _in_new_session(
+        fn: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any
+    ) -> T:
+        """
+        Run a query helper on a session of its own
+        
+        An AsyncSession can't execute statements concurrently, so helpers that
+        are gathered together each get their own session and pooled connection.
+        """
+        async with AsyncSessionLocal() as session:
+            return await fn(session, *args, **kwargs)
+    
+    @staticmethod
+    @_ttl_cached
     async def get_summary_statistics(
         db: AsyncSession,
         start_date: Optional[datetime] = None,
@@ -23,21 +231,60 @@ class AnalyticsService:
         """
         Get summary statistics for dashboard
         """
-        # Build base query
+        # Date filters shared by all queries
         filters = []
         if start_date:
             filters.append(Incident.timestamp >= start_date)
         if end_date:
             filters.append(Incident.timestamp <= end_date)
         
-        # Total incidents
-        total_query = select(func.count(Incident.id))
+        # Total and recent (last 7 days) counts in one scan; the recent count
+        # ignores the date filters, as before
+        seven_days_ago = datetime.utcnow() - timedelta(days=7)
+        recent_filter = Incident.timestamp >= seven_days_ago
         if filters:
-            total_query = total_query.where(and_(*filters))
-        total_incidents = await db.scalar(total_query) or 0
+            counts_query = select(
+                func.count(Incident.id).filter(and_(*filters)),
+                func.count(Incident.id).filter(recent_filter)
+            ).where(or_(and_(*filters), recent_filter))
+        else:
+            counts_query = select(
+                func.count(Incident.id),
+                func.count(Incident.id).filter(recent_filter)
+            )
+        
+        # Group-by aggregates run concurrently on their own sessions
+        counts_result, waste_type_distribution, top_locations = await asyncio.gather(
+            db.execute(counts_query),
+            AnalyticsService._in_new_session(
+                AnalyticsService._waste_type_distribution, filters
+            ),
+            AnalyticsService._in_new_session(
+                AnalyticsService._top_locations, filters
+            )
+        )
+        total_incidents, recent_incidents = counts_result.one()
         
-        # Incidents by waste type
-        waste_type_query = (
+        return {
+            "total_incidents": total_incidents,
+            "recent_incidents_7d": recent_incidents,
+            "waste_type_distribution": waste_type_distribution,
+            "top_locations": top_locations,
+            "period": {
+                "start_date": start_date.isoformat() if start_date else None,
+                "end_date": end_date.isoformat() if end_date else None
+            }
+        }
+    
+    @staticmethod
+    async def _waste_type_distribution(
+        db: AsyncSession,
+        filters: List[Any]
+    ) -> Dict[str, int]:
+        """
+        Incident counts per waste type
+        """
+        query = (
             select(
                 Incident.waste_type,
                 func.count(Incident.id).label('count')
@@ -45,50 +292,36 @@ class AnalyticsService:
             .where(Incident.waste_type.isnot(None))
         )
         if filters:
-            waste_type_query = waste_type_query.where(and_(*filters))
-        waste_type_query = waste_type_query.group_by(Incident.waste_type)
-        
-        result = await db.execute(waste_type_query)
-        waste_type_distribution = {
-            row[0]: row[1] for row in result.fetchall()
-        }
-        
-        # Recent incidents count (last 7 days)
-        seven_days_ago = datetime.utcnow() - timedelta(days=7)
-        recent_query = select(func.count(Incident.id)).where(
-            Incident.timestamp >= seven_days_ago
-        )
-        recent_incidents = await db.scalar(recent_query) or 0
+            query = query.where(and_(*filters))
+        query = query.group_by(Incident.waste_type)
         
-        # Most common locations
-        location_query = (
+        result = await db.execute(query)
+        return dict(result.tuples().all())
+    
+    @staticmethod
+    async def _top_locations(
+        db: AsyncSession,
+        filters: List[Any],
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Most common incident locations
+        """
+        # Filters come before the aggregate; location breaks count ties so
+        # the top N is stable between calls
+        query = (
             select(
                 Incident.location,
                 func.count(Incident.id).label('count')
             )
+            .where(*filters)
             .group_by(Incident.location)
-            .order_by(desc('count'))
-            .limit(10)
+            .order_by(desc('count'), Incident.location)
+            .limit(limit)
         )
-        if filters:
-            location_query = location_query.where(and_(*filters))
-        
-        result = await db.execute(location_query)
-        top_locations = [
-            {"location": row[0], "count": row[1]}
-            for row in result.fetchall()
-        ]
         
-        return {
-            "total_incidents": total_incidents,
-            "recent_incidents_7d": recent_incidents,
-            "waste_type_distribution": waste_type_distribution,
-            "top_locations": top_locations,
-            "period": {
-                "start_date": start_date.isoformat() if start_date else None,
-                "end_date": end_date.isoformat() if end_date else None
-            }
-        }
+        result = await db.execute(query)
+        return [dict(row) for row in result.mappings()]
     
     @staticmethod
     async def get_time_series_data(
@@ -100,21 +333,24 @@ class AnalyticsService:
         Get time series data for trend analysis
         """
         start_date = datetime.utcnow() - timedelta(days=days)
+        daily = AnalyticsService._daily_columns()
         
-        # Query incidents grouped by time period
+        # Query incidents grouped by time period (units are inlined as
+        # literals so the expressions match the idx_incidents_* indexes)
+        truncated = cast(daily.day, DateTime) if daily.from_rollup else Incident.timestamp
         if group_by == "day":
-            time_format = func.date(Incident.timestamp)
+            time_format = daily.day
         elif group_by == "week":
-            time_format = func.date_trunc('week', Incident.timestamp)
+            time_format = func.date_trunc(literal_column("'week'"), truncated)
         else:  # month
-            time_format = func.date_trunc('month', Incident.timestamp)
+            time_format = func.date_trunc(literal_column("'month'"), truncated)
         
         query = (
             select(
                 time_format.label('period'),
-                func.count(Incident.id).label('count')
+                daily.count().label('count')
             )
-            .where(Incident.timestamp >= start_date)
+            .where(daily.time >= daily.bound(start_date))
             .group_by('period')
             .order_by('period')
         )
@@ -123,10 +359,10 @@ class AnalyticsService:
         
         time_series = [
             {
-                "period": row[0].isoformat() if hasattr(row[0], 'isoformat') else str(row[0]),
-                "count": row[1]
+                "period": period.isoformat() if hasattr(period, 'isoformat') else str(period),
+                "count": count
             }
-            for row in result.fetchall()
+            for period, count in result.tuples()
         ]
         
         return time_series
@@ -140,35 +376,35 @@ class AnalyticsService:
         Get waste type trends over time
         """
         start_date = datetime.utcnow() - timedelta(days=days)
+        daily = AnalyticsService._daily_columns()
         
         query = (
             select(
-                func.date(Incident.timestamp).label('date'),
-                Incident.waste_type,
-                func.count(Incident.id).label('count')
+                daily.day.label('date'),
+                daily.waste_type,
+                daily.count().label('count')
             )
             .where(
                 and_(
-                    Incident.timestamp >= start_date,
-                    Incident.waste_type.isnot(None)
+                    daily.time >= daily.bound(start_date),
+                    daily.waste_type.isnot(None)
                 )
             )
-            .group_by('date', Incident.waste_type)
+            .group_by('date', daily.waste_type)
             .order_by('date')
         )
         
-        result = await db.execute(query)
+        result = await db.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
         
         # Organize by waste type
         trends = {}
-        for row in result.fetchall():
-            waste_type = row[1]
+        async for date, waste_type, count in result.tuples():
             if waste_type not in trends:
                 trends[waste_type] = []
             
             trends[waste_type].append({
-                "date": row[0].isoformat(),
-                "count": row[2]
+                "date": date.isoformat(),
+                "count": count
             })
         
         return trends
@@ -177,10 +413,14 @@ class AnalyticsService:
     async def get_location_heatmap_data(
         db: AsyncSession,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        cell_size: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """
         Get location-based incident data for heatmap visualization
+        
+        With cell_size (degrees), coordinates are snapped to a grid in SQL
+        and one point is returned per cell instead of per unique coordinate.
         """
         filters = [
             Incident.latitude.isnot(None),
@@ -192,80 +432,81 @@ class AnalyticsService:
         if end_date:
             filters.append(Incident.timestamp <= end_date)
         
-        query = (
-            select(
-                Incident.location,
-                Incident.latitude,
-                Incident.longitude,
-                func.count(Incident.id).label('count')
+        if cell_size:
+            # Snap in a subquery so the GROUP BY doesn't repeat the bound cell size
+            cells = (
+                select(
+                    Incident.location,
+                    (func.round(Incident.latitude / cell_size) * cell_size).label('latitude'),
+                    (func.round(Incident.longitude / cell_size) * cell_size).label('longitude')
+                )
+                .where(and_(*filters))
+                .subquery('cells')
+            )
+            query = (
+                select(
+                    func.min(cells.c.location).label('location'),
+                    cells.c.latitude,
+                    cells.c.longitude,
+                    func.count().label('count')
+                )
+                .group_by(cells.c.latitude, cells.c.longitude)
+            )
+        else:
+            query = (
+                select(
+                    Incident.location,
+                    Incident.latitude,
+                    Incident.longitude,
+                    func.count(Incident.id).label('count')
+                )
+                .where(and_(*filters))
+                .group_by(Incident.location, Incident.latitude, Incident.longitude)
             )
-            .where(and_(*filters))
-            .group_by(Incident.location, Incident.latitude, Incident.longitude)
-        )
-        
-        result = await db.execute(query)
         
-        heatmap_data = [
-            {
-                "location": row[0],
-                "latitude": float(row[1]),
-                "longitude": float(row[2]),
-                "count": row[3]
-            }
-            for row in result.fetchall()
-        ]
+        # One row per coordinate (or cell) can be large; stream it in batches
+        result = await db.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
         
-        return heatmap_data
+        # Column labels match the response keys (coordinates are Float already)
+        return [dict(row) async for row in result.mappings()]
     
     @staticmethod
     async def detect_anomalies(
         db: AsyncSession,
-        threshold_multiplier: float = 2.0
+        threshold_multiplier: float = 2.0,
+        z_threshold: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """
         Detect anomalies - locations or time periods with unusually high incident counts
-        """
-        # Get incidents per location
-        location_query = (
-            select(
-                Incident.location,
-                func.count(Incident.id).label('count')
-            )
-            .group_by(Incident.location)
-        )
-        
-        result = await db.execute(location_query)
-        location_counts = [row[1] for row in result.fetchall()]
-        
-        if not location_counts:
-            return []
-        
-        # Calculate mean and threshold
-        mean_count = sum(location_counts) / len(location_counts)
-        threshold = mean_count * threshold_multiplier
         
-        # Find anomalous locations
-        anomaly_query = (
-            select(
-                Incident.location,
-                func.count(Incident.id).label('count')
+        By default a location is anomalous above threshold_multiplier times
+        the mean count. When z_threshold is given, it must instead exceed
+        mean + z_threshold * standard deviation.
+        """
+        if z_threshold is not None:
+            result = await db.execute(_LOCATION_ZSCORE_STMT, {"z_threshold": z_threshold})
+        else:
+            result = await db.execute(
+                _LOCATION_ANOMALY_STMT,
+                {"threshold_multiplier": threshold_multiplier}
             )
-            .group_by(Incident.location)
-            .having(func.count(Incident.id) > threshold)
-        )
         
-        result = await db.execute(anomaly_query)
-        
-        anomalies = [
-            {
-                "location": row[0],
-                "count": row[1],
+        anomalies = []
+        for location, count, mean, std_dev in result.tuples():
+            mean_count = float(mean)
+            if z_threshold is not None:
+                threshold = mean_count + z_threshold * float(std_dev)
+                high = mean_count + 1.5 * z_threshold * float(std_dev)
+            else:
+                threshold = mean_count * threshold_multiplier
+                high = threshold * 1.5
+            anomalies.append({
+                "location": location,
+                "count": count,
                 "mean": round(mean_count, 2),
                 "threshold": round(threshold, 2),
-                "severity": "high" if row[1] > threshold * 1.5 else "medium"
-            }
-            for row in result.fetchall()
-        ]
+                "severity": "high" if count > high else "medium"
+            })
         
         logger.info(f"Detected {len(anomalies)} anomalous locations")
         
@@ -279,27 +520,13 @@ class AnalyticsService:
         """
         Get most frequent keywords across all incidents
         """
-        query = select(Incident.keywords).where(Incident.keywords.isnot(None))
-        result = await db.execute(query)
+        result = await db.execute(_KEYWORD_FREQUENCY_STMT, {"limit": limit})
         
-        # Flatten all keywords
-        all_keywords = []
-        for row in result.fetchall():
-            if row[0]:
-                all_keywords.extend(row[0])
-        
-        # Count frequencies
-        keyword_counts = Counter(all_keywords)
-        
-        # Get top N
-        top_keywords = [
-            {"keyword": keyword, "count": count}
-            for keyword, count in keyword_counts.most_common(limit)
-        ]
-        
-        return top_keywords
+        # Column labels match the response keys
+        return [dict(row) for row in result.mappings()]
     
     @staticmethod
+    @_ttl_cached
     async def analyze_trends(
         db: AsyncSession,
         days: int = 30
@@ -318,44 +545,17 @@ class AnalyticsService:
         current_start = current_end - timedelta(days=days)
         previous_start = current_start - timedelta(days=days)
         
-        # Get waste type counts for current period
-        current_query = (
-            select(
-                Incident.waste_type,
-                func.count(Incident.id).label('count')
-            )
-            .where(
-                and_(
-                    Incident.timestamp >= current_start,
-                    Incident.timestamp <= current_end,
-                    Incident.waste_type.isnot(None)
-                )
-            )
-            .group_by(Incident.waste_type)
-        )
-        
-        result = await db.execute(current_query)
-        current_counts = {row[0]: row[1] for row in result.fetchall()}
-        
-        # Get waste type counts for previous period
-        previous_query = (
-            select(
-                Incident.waste_type,
-                func.count(Incident.id).label('count')
+        # Period counts and daily spikes are independent queries,
+        # so run them concurrently on separate sessions
+        (current_counts, previous_counts), spikes = await asyncio.gather(
+            AnalyticsService._period_waste_type_counts(
+                db, previous_start, current_start, current_end
+            ),
+            AnalyticsService._in_new_session(
+                AnalyticsService._detect_daily_spikes, days=7
             )
-            .where(
-                and_(
-                    Incident.timestamp >= previous_start,
-                    Incident.timestamp < current_start,
-                    Incident.waste_type.isnot(None)
-                )
-            )
-            .group_by(Incident.waste_type)
         )
         
-        result = await db.execute(previous_query)
-        previous_counts = {row[0]: row[1] for row in result.fetchall()}
-        
         # Analyze trends
         rising_trends = []
         falling_trends = []
@@ -404,9 +604,6 @@ class AnalyticsService:
         rising_trends.sort(key=lambda x: abs(x['change_percentage']), reverse=True)
         falling_trends.sort(key=lambda x: abs(x['change_percentage']), reverse=True)
         
-        # Detect spikes (day-over-day analysis for last 7 days)
-        spikes = await AnalyticsService._detect_daily_spikes(db, days=7)
-        
         logger.info(
             "Trend analysis completed",
             rising=len(rising_trends),
@@ -432,6 +629,50 @@ class AnalyticsService:
             }
         }
     
+    @staticmethod
+    async def _period_waste_type_counts(
+        db: AsyncSession,
+        previous_start: datetime,
+        current_start: datetime,
+        current_end: datetime
+    ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Incident counts per waste type for the current and previous periods
+        
+        Both periods are counted in one scan with FILTER aggregates:
+        current is [current_start, current_end], previous is
+        [previous_start, current_start).
+        """
+        daily = AnalyticsService._daily_columns()
+        current_from = daily.bound(current_start)
+        query = (
+            select(
+                daily.waste_type,
+                daily.count(daily.time >= current_from).label('current_count'),
+                daily.count(daily.time < current_from).label('previous_count')
+            )
+            .where(
+                and_(
+                    daily.time >= daily.bound(previous_start),
+                    daily.time <= daily.bound(current_end),
+                    daily.waste_type.isnot(None)
+                )
+            )
+            .group_by(daily.waste_type)
+        )
+        
+        result = await db.execute(query)
+        
+        current_counts = {}
+        previous_counts = {}
+        for waste_type, current, previous in result.tuples():
+            if current:
+                current_counts[waste_type] = current
+            if previous:
+                previous_counts[waste_type] = previous
+        
+        return current_counts, previous_counts
+    
     @staticmethod
     async def _detect_daily_spikes(
         db: AsyncSession,
@@ -442,47 +683,53 @@ class AnalyticsService:
         Detect daily spikes - days with unusually high incident counts
         """
         start_date = datetime.utcnow() - timedelta(days=days)
+        daily = AnalyticsService._daily_columns()
         
-        # Get daily counts
-        query = (
+        # Daily counts with the mean, population standard deviation and
+        # number of days attached by window functions, filtered in one query
+        daily_counts = (
             select(
-                func.date(Incident.timestamp).label('date'),
-                func.count(Incident.id).label('count')
+                daily.day.label('date'),
+                daily.count().label('count'),
+                func.avg(daily.count()).over().label('mean'),
+                func.stddev_pop(daily.count()).over().label('std_dev'),
+                func.count().over().label('days')
             )
-            .where(Incident.timestamp >= start_date)
+            .where(daily.time >= daily.bound(start_date))
             .group_by('date')
-            .order_by('date')
+            .subquery()
+        )
+        query = (
+            select(daily_counts.c.date, daily_counts.c.count, daily_counts.c.mean, daily_counts.c.std_dev)
+            .where(
+                and_(
+                    daily_counts.c.days >= 3,
+                    daily_counts.c.count
+                    > daily_counts.c.mean + spike_threshold * daily_counts.c.std_dev
+                )
+            )
+            .order_by(daily_counts.c.date)
         )
         
         result = await db.execute(query)
-        daily_counts = [(row[0], row[1]) for row in result.fetchall()]
-        
-        if len(daily_counts) < 3:
-            return []
-        
-        # Calculate mean and standard deviation
-        counts = [count for _, count in daily_counts]
-        mean_count = sum(counts) / len(counts)
-        variance = sum((x - mean_count) ** 2 for x in counts) / len(counts)
-        std_dev = variance ** 0.5
-        
-        threshold = mean_count + (spike_threshold * std_dev)
         
-        # Find spikes
         spikes = []
-        for date, count in daily_counts:
-            if count > threshold:
-                spikes.append({
-                    "date": date.isoformat(),
-                    "count": count,
-                    "mean": round(mean_count, 1),
-                    "threshold": round(threshold, 1),
-                    "severity": "high" if count > mean_count + (4 * std_dev) else "medium"
-                })
+        for date, count, mean, std_dev in result.tuples():
+            mean_count = float(mean)
+            std_dev = float(std_dev)
+            threshold = mean_count + (spike_threshold * std_dev)
+            spikes.append({
+                "date": date.isoformat(),
+                "count": count,
+                "mean": round(mean_count, 1),
+                "threshold": round(threshold, 1),
+                "severity": "high" if count > mean_count + (4 * std_dev) else "medium"
+            })
         
         return spikes
     
     @staticmethod
+    @_ttl_cached
     async def generate_admin_summary(
         db: AsyncSession,
         days: int = 7
@@ -499,21 +746,28 @@ class AnalyticsService:
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=days)
         
-        # Get basic statistics
-        stats = await AnalyticsService.get_summary_statistics(
-            db,
-            start_date=start_date,
-            end_date=end_date
+        # Statistics, trends, anomalies and top keywords are independent;
+        # run them concurrently, each helper beyond the first on its own session
+        stats, trends, anomalies, keywords = await asyncio.gather(
+            AnalyticsService.get_summary_statistics(
+                db,
+                start_date=start_date,
+                end_date=end_date
+            ),
+            AnalyticsService._in_new_session(
+                AnalyticsService.analyze_trends, days=days
+            ),
+            AnalyticsService._in_new_session(
+                AnalyticsService.detect_anomalies, threshold_multiplier=2.0
+            ),
+            AnalyticsService._in_new_session(
+                AnalyticsService.get_keyword_frequency, limit=10
+            )
         )
         
-        # Get trends
-        trends = await AnalyticsService.analyze_trends(db, days=days)
-        
-        # Get anomalies
-        anomalies = await AnalyticsService.detect_anomalies(db, threshold_multiplier=2.0)
-        
-        # Get top keywords
-        keywords = await AnalyticsService.get_keyword_frequency(db, limit=10)
+        # Dominant waste type, shared by the insight and the executive summary
+        distribution = stats['waste_type_distribution']
+        most_common = max(distribution.items(), key=itemgetter(1)) if distribution else None
         
         # Generate natural language insights
         insights = []
@@ -579,11 +833,7 @@ class AnalyticsService:
             })
         
         # Most common waste type
-        if stats['waste_type_distribution']:
-            most_common = max(
-                stats['waste_type_distribution'].items(),
-                key=lambda x: x[1]
-            )
+        if most_common:
             percentage = (most_common[1] / total * 100) if total > 0 else 0
             insights.append({
                 "type": "dominant_type",
@@ -614,7 +864,7 @@ class AnalyticsService:
         
         # Generate executive summary (single paragraph)
         executive_summary = AnalyticsService._generate_executive_summary(
-            total, trends, anomalies, stats, days
+            total, trends, anomalies, most_common, days
         )
         
         logger.info(f"Generated admin summary with {len(insights)} insights")
@@ -634,7 +884,7 @@ class AnalyticsService:
         total: int,
         trends: Dict[str, Any],
         anomalies: List[Dict[str, Any]],
-        stats: Dict[str, Any],
+        most_common: Optional[Tuple[str, int]],
         days: int
     ) -> str:
         """
@@ -655,8 +905,7 @@ class AnalyticsService:
             parts.append(f"A hotspot was identified at {anomalies[0]['location']} with {anomalies[0]['count']} incidents")
         
         # Most common type
-        if stats['waste_type_distribution']:
-            most_common = max(stats['waste_type_distribution'].items(), key=lambda x: x[1])
+        if most_common:
             parts.append(f"{most_common[0].title()} waste remains the most common type with {most_common[1]} incidents")
         
         # Positive trend if exists
@@ -1,11 +1,11 @@
 """
 Incident Database Models
 """
-from sqlalchemy import Column, String, DateTime, Float, Text, Index
+from sqlalchemy import Column, String, DateTime, Float, Text, Index, LargeBinary, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from datetime import datetime
 import uuid
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 
 from app.core.database import Base
 
@@ -26,7 +26,9 @@ class Incident(Base):
     # AI-generated fields
     waste_type = Column(String(100), nullable=True, index=True)
     waste_type_confidence = Column(Float, nullable=True)
-    embedding = Column(Vector(384), nullable=True)  # all-MiniLM-L6-v2 produces 384-dim vectors
+    embedding = Column(HALFVEC(384), nullable=True)  # L2-normalized all-MiniLM-L6-v2 384-dim vectors, stored as fp16
+    embedding_i8 = Column(LargeBinary, nullable=True)  # int8-quantized embedding bytes
+    embedding_scale = Column(Float, nullable=True)  # dequantization scale for embedding_i8
     keywords = Column(ARRAY(String), nullable=True)
     
     # Similar incidents
@@ -39,9 +41,47 @@ class Incident(Base):
     # Indexes for performance
     __table_args__ = (
         Index('idx_timestamp_desc', timestamp.desc()),
-        Index('idx_waste_type', waste_type),
         Index('idx_location', location),
+        # Expression indexes matching the analytics time-bucket GROUP BYs
+        Index('idx_incidents_day', func.date(timestamp)),
+        Index('idx_incidents_week', func.date_trunc('week', timestamp)),
+        Index('idx_incidents_month', func.date_trunc('month', timestamp)),
+        # Covering indexes so time-windowed GROUP BYs can use index-only scans
+        Index('idx_ts_waste_cover', timestamp, waste_type, postgresql_include=['id']),
+        Index('idx_ts_location_cover', timestamp, location, postgresql_include=['id']),
+        # Location heatmap grouping
+        Index('idx_incidents_loc_geo', location, latitude, longitude),
+        # Trigram indexes for the list endpoint's ILIKE '%...%' filters (pg_trgm)
+        Index('idx_incidents_waste_type_trgm', waste_type,
+              postgresql_using='gin', postgresql_ops={'waste_type': 'gin_trgm_ops'}),
+        Index('idx_incidents_location_trgm', location,
+              postgresql_using='gin', postgresql_ops={'location': 'gin_trgm_ops'}),
     )
     
     def __repr__(self):
         return f"<Incident(id={self.id}, waste_type={self.waste_type}, location={self.location})>"
+
+
+class IncidentKeyword(Base):
+    """
+    Incident keywords, one row per (incident, keyword)
+    
+    Kept in sync with Incident.keywords by a database trigger (see init_db),
+    so keyword rollups are a plain GROUP BY over an index.
+    """
+    __tablename__ = "incident_keywords"
+    
+    incident_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("incidents.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    # Unbounded like the Incident.keywords entries it mirrors
+    keyword = Column(Text, primary_key=True)
+    
+    __table_args__ = (
+        Index('idx_incident_keywords_keyword', keyword),
+    )
+    
+    def __repr__(self):
+        return f"<IncidentKeyword(incident_id={self.incident_id}, keyword={self.keyword})>"
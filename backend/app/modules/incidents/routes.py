@@ -1,26 +1,66 @@
 """
 Incident API Routes
 """
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
 import math
 
-from app.core.database import get_db
+from app.core.database import get_db, AsyncSessionLocal
 from app.modules.incidents.schemas import (
     IncidentCreate,
     IncidentUpdate,
     IncidentResponse,
-    IncidentListResponse
+    IncidentListResponse,
+    INCIDENT_LIST_ADAPTER
 )
 from app.modules.incidents.service import IncidentService
+from app.modules.ai.service import AIService, get_ai_service
 from app.core.logging import logger
 
 router = APIRouter()
 
 
+async def _run_ai_pipeline(incident_id: UUID, description: str, location: str):
+    """
+    Classify, embed and link a newly created incident (runs after the response)
+    
+    Uses its own session since the request session is closed by then.
+    """
+    try:
+        ai_service = await get_ai_service()
+        
+        # Process AI features
+        ai_result = await ai_service.process_incident(description, location)
+        
+        async with AsyncSessionLocal() as db:
+            # Find similar incidents
+            similar_incidents = await ai_service.find_similar_incidents(
+                db,
+                incident_id,
+                ai_result["embedding"]
+            )
+            
+            # Store all AI results in a single update
+            await IncidentService.update_ai_fields(
+                db,
+                incident_id,
+                waste_type=ai_result["waste_type"],
+                confidence=ai_result["confidence"],
+                embedding=ai_result["embedding"],
+                keywords=ai_result["keywords"],
+                similar_incident_ids=[inc.id for inc in similar_incidents] or None
+            )
+            
+            await db.commit()
+    
+    except Exception as e:
+        logger.error(f"Error processing incident {incident_id} with AI: {str(e)}", exc_info=True)
+
+
 @router.post(
     "/",
     response_model=IncidentResponse,
@@ -29,12 +69,14 @@ router = APIRouter()
 )
 async def create_incident(
     incident_data: IncidentCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new waste incident report.
     
-    The incident will be automatically processed by AI to:
+    The incident is returned as soon as it is stored, then processed by AI
+    in the background to:
     - Classify waste type
     - Extract keywords
     - Detect similar incidents
@@ -42,48 +84,16 @@ async def create_incident(
     try:
         # Create incident
         incident = await IncidentService.create_incident(db, incident_data)
+        await db.commit()
+        await db.refresh(incident)
         
-        # Process with AI in background (we'll trigger this after creation)
-        from app.modules.ai.service import AIService
-        ai_service = AIService()
-        
-        # Ensure AI service is initialized (lazy loading)
-        await ai_service.initialize()
-        
-        # Process AI features
-        ai_result = await ai_service.process_incident(incident.description, incident.location)
-        
-        # Update incident with AI results
-        await IncidentService.update_ai_fields(
-            db,
-            incident.id,
-            waste_type=ai_result["waste_type"],
-            confidence=ai_result["confidence"],
-            embedding=ai_result["embedding"],
-            keywords=ai_result["keywords"]
-        )
-        
-        # Find similar incidents
-        similar_incidents = await ai_service.find_similar_incidents(
-            db,
+        background_tasks.add_task(
+            _run_ai_pipeline,
             incident.id,
-            ai_result["embedding"]
+            incident.description,
+            incident.location
         )
         
-        if similar_incidents:
-            await IncidentService.update_ai_fields(
-                db,
-                incident.id,
-                waste_type=ai_result["waste_type"],
-                confidence=ai_result["confidence"],
-                embedding=ai_result["embedding"],
-                keywords=ai_result["keywords"],
-                similar_incident_ids=[inc.id for inc in similar_incidents]
-            )
-        
-        await db.commit()
-        await db.refresh(incident)
-        
         return incident
         
     except Exception as e:
@@ -106,32 +116,47 @@ async def list_incidents(
     location: Optional[str] = Query(None, description="Filter by location"),
     start_date: Optional[datetime] = Query(None, description="Filter by start date"),
     end_date: Optional[datetime] = Query(None, description="Filter by end date"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (overrides page)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     List all incidents with pagination and optional filters.
+    
+    For deep pages, pass the previous response's `next_cursor` as `cursor`
+    instead of a page number. With a cursor and no filters, `total` is an
+    estimate.
     """
     try:
-        incidents, total = await IncidentService.list_incidents(
+        incidents, total, next_cursor = await IncidentService.list_incidents(
             db,
             page=page,
             page_size=page_size,
             waste_type=waste_type,
             location=location,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            cursor=cursor
         )
         
         total_pages = math.ceil(total / page_size) if total > 0 else 0
         
-        return IncidentListResponse(
-            items=incidents,
+        # Items are validated once by the prebuilt adapter; the page is
+        # returned as ORJSONResponse so FastAPI doesn't validate it again
+        response = IncidentListResponse.model_construct(
+            items=INCIDENT_LIST_ADAPTER.validate_python(incidents, from_attributes=True),
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=next_cursor
         )
+        return ORJSONResponse(response.model_dump(mode="json"))
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error listing incidents: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -223,7 +248,8 @@ async def semantic_search(
     query: str = Query(..., description="Natural language search query"),
     threshold: float = Query(0.70, ge=0.0, le=1.0, description="Similarity threshold (0-1)"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    ai_service: AIService = Depends(get_ai_service)
 ):
     """
     Search for incidents using natural language semantic similarity.
@@ -237,43 +263,11 @@ async def semantic_search(
     - "electronic waste disposal"
     """
     try:
-        from app.modules.ai.service import AIService
-        from app.modules.incidents.models import Incident
-        from sqlalchemy import select
-        import numpy as np
-        from sklearn.metrics.pairwise import cosine_similarity
-        
-        # Initialize AI service
-        ai_service = AIService()
-        await ai_service.initialize()
-        
         # Generate embedding for search query
-        query_embedding = ai_service.generate_embedding(query)
-        
-        # Get all incidents with embeddings
-        result = await db.execute(
-            select(Incident).where(Incident.embedding.isnot(None))
-        )
-        all_incidents = result.scalars().all()
-        
-        if not all_incidents:
-            return []
-        
-        # Calculate similarities
-        query_vector = np.array(query_embedding).reshape(1, -1)
-        similarities = []
-        
-        for incident in all_incidents:
-            if incident.embedding is not None and len(incident.embedding) > 0:
-                incident_vector = np.array(incident.embedding).reshape(1, -1)
-                similarity = cosine_similarity(query_vector, incident_vector)[0][0]
-                
-                if similarity >= threshold:
-                    similarities.append((incident, float(similarity)))
+        query_embedding = await ai_service.generate_embedding(query)
         
-        # Sort by similarity (descending) and return top N
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        results = [inc for inc, sim in similarities[:limit]]
+        # Ranked and thresholded in PostgreSQL; only the top matches are returned
+        results = await ai_service.search_incidents(db, query_embedding, threshold, limit)
         
         logger.info(
             "Semantic search completed",
@@ -1,7 +1,7 @@
 """
 Incident Pydantic Schemas
 """
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
@@ -19,6 +19,9 @@ class IncidentBase(BaseModel):
     @classmethod
     def remove_timezone(cls, v):
         """Remove timezone info to match PostgreSQL TIMESTAMP WITHOUT TIME ZONE"""
+        # Fast path: naive datetimes (every ORM-loaded response) pass through
+        if isinstance(v, datetime) and v.tzinfo is None:
+            return v
         if v is None:
             return datetime.utcnow()
         if isinstance(v, str):
@@ -47,6 +50,8 @@ class IncidentUpdate(BaseModel):
 
 class IncidentResponse(IncidentBase):
     """Schema for incident response"""
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
+    
     id: UUID
     waste_type: Optional[str] = None
     waste_type_confidence: Optional[float] = None
@@ -54,9 +59,10 @@ class IncidentResponse(IncidentBase):
     similar_incident_ids: Optional[List[UUID]] = None
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+
+# Built once; validates a page of ORM incidents in a single call
+INCIDENT_LIST_ADAPTER = TypeAdapter(List[IncidentResponse])
 
 
 class IncidentListResponse(BaseModel):
@@ -66,9 +72,4 @@ class IncidentListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
-
-
-class SimilarIncident(BaseModel):
-    """Schema for similar incident detection"""
-    incident: IncidentResponse
-    similarity_score: float
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the following page
@@ -2,17 +2,51 @@
 Incident Service - Business Logic Layer
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
-from typing import List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import event, select, update, delete, func, or_, text, tuple_
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
+from cachetools import TTLCache
+import base64
 import math
 
 from app.modules.incidents.models import Incident
 from app.modules.incidents.schemas import IncidentCreate, IncidentUpdate
+from app.modules.analytics.service import AnalyticsService
 from app.core.logging import logger, audit_logger
 
 
+# Filtered list totals, keyed on the filter values; cleared when a write
+# commits, and totals counted across a commit are not stored
+_total_cache: TTLCache = TTLCache(maxsize=512, ttl=30)
+_total_generation = 0
+
+
+def _invalidate_after_commit(db: AsyncSession) -> None:
+    """
+    Drop incident-derived caches once db's transaction commits
+    
+    Invalidating earlier would let a concurrent reader, still seeing the
+    pre-write snapshot, cache stale results right after the clear.
+    """
+    db.info["incidents_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    global _total_generation
+    if session.info.pop("incidents_changed", False):
+        _total_generation += 1
+        _total_cache.clear()
+        AnalyticsService.invalidate_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_rollback(session: Session) -> None:
+    session.info.pop("incidents_changed", None)
+
+
 class IncidentService:
     """Service for handling incident business logic"""
     
@@ -33,6 +67,7 @@ class IncidentService:
         db.add(incident)
         await db.flush()
         await db.refresh(incident)
+        _invalidate_after_commit(db)
         
         audit_logger.log_action(
             action="create",
@@ -54,11 +89,23 @@ class IncidentService:
         db: AsyncSession,
         incident_id: UUID
     ) -> Optional[Incident]:
-        """Get incident by ID"""
-        result = await db.execute(
-            select(Incident).where(Incident.id == incident_id)
-        )
-        return result.scalar_one_or_none()
+        """Get incident by ID (served from the session identity map when loaded)"""
+        return await db.get(Incident, incident_id)
+    
+    @staticmethod
+    def encode_cursor(incident: Incident) -> str:
+        """Opaque keyset cursor for the position just after an incident"""
+        raw = f"{incident.timestamp.isoformat()}|{incident.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+    
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+        """Parse a cursor from encode_cursor (raises ValueError if malformed)"""
+        try:
+            timestamp, incident_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            return datetime.fromisoformat(timestamp), UUID(incident_id)
+        except Exception as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
     
     @staticmethod
     async def list_incidents(
@@ -68,12 +115,18 @@ class IncidentService:
         waste_type: Optional[str] = None,
         location: Optional[str] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> tuple[List[Incident], int]:
-        """List incidents with pagination and filters"""
+        end_date: Optional[datetime] = None,
+        cursor: Optional[str] = None
+    ) -> tuple[List[Incident], int, Optional[str]]:
+        """
+        List incidents with pagination and filters
         
-        # Build query with filters
-        query = select(Incident)
+        Pages are addressed by number (OFFSET) or, for deep pages, by the
+        cursor returned with the previous page (keyset on timestamp, id).
+        Returns (incidents, total, next_cursor).
+        """
+        
+        # Build filters
         filters = []
         
         if waste_type:
@@ -89,24 +142,91 @@ class IncidentService:
         if end_date:
             filters.append(Incident.timestamp <= end_date)
         
-        if filters:
-            query = query.where(and_(*filters))
+        ordering = (Incident.timestamp.desc(), Incident.id.desc())
+        
+        # Totals rarely change between page requests; reuse them briefly
+        totals_key = (waste_type, location, start_date, end_date)
+        generation = _total_generation
+        total = _total_cache.get(totals_key)
+        # Only exact counts are cached; reltuples estimates are not
+        total_exact = True
         
-        # Get total count
-        count_query = select(func.count()).select_from(Incident)
-        if filters:
-            count_query = count_query.where(and_(*filters))
+        if cursor:
+            # Keyset page: seek past the cursor instead of skipping rows
+            cursor_timestamp, cursor_id = IncidentService.decode_cursor(cursor)
+            query = (
+                select(Incident)
+                .where(
+                    *filters,
+                    tuple_(Incident.timestamp, Incident.id) < tuple_(cursor_timestamp, cursor_id)
+                )
+                .order_by(*ordering)
+                .limit(page_size)
+            )
+            result = await db.execute(query)
+            incidents = list(result.scalars().all())
+            if total is None:
+                total, total_exact = await IncidentService._count_incidents(db, filters)
+        elif total is not None:
+            query = (
+                select(Incident)
+                .where(*filters)
+                .order_by(*ordering)
+                .offset((page - 1) * page_size)
+                .limit(page_size)
+            )
+            result = await db.execute(query)
+            incidents = list(result.scalars().all())
+        else:
+            # Page rows with the total count attached by a window function,
+            # so one query serves both
+            query = (
+                select(Incident, func.count().over().label('total'))
+                .where(*filters)
+                .order_by(*ordering)
+                .offset((page - 1) * page_size)
+                .limit(page_size)
+            )
+            
+            result = await db.execute(query)
+            rows = result.all()
+            incidents = [row[0] for row in rows]
+            
+            if rows:
+                total = rows[0][1]
+            elif page > 1:
+                # Past the last page no row carries the total; count separately
+                total, total_exact = await IncidentService._count_incidents(db, filters)
+            else:
+                total = 0
         
-        total = await db.scalar(count_query)
+        if total_exact and generation == _total_generation:
+            _total_cache[totals_key] = total
         
-        # Apply pagination and ordering
-        query = query.order_by(Incident.timestamp.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
+        next_cursor = (
+            IncidentService.encode_cursor(incidents[-1])
+            if len(incidents) == page_size else None
+        )
+        return incidents, total, next_cursor
+    
+    @staticmethod
+    async def _count_incidents(db: AsyncSession, filters: List[Any]) -> tuple[int, bool]:
+        """
+        Total incidents matching the filters, and whether it is exact
         
-        result = await db.execute(query)
-        incidents = result.scalars().all()
+        Unfiltered totals use the planner's row estimate (pg_class.reltuples)
+        rather than scanning the table.
+        """
+        if not filters:
+            estimate = await db.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'incidents'::regclass")
+            )
+            # -1 means the table has never been analyzed
+            if estimate is not None and estimate >= 0:
+                return estimate, False
         
-        return list(incidents), total or 0
+        total = await db.scalar(select(func.count()).select_from(Incident).where(*filters))
+        return total or 0, True
     
     @staticmethod
     async def update_incident(
@@ -115,20 +235,16 @@ class IncidentService:
         incident_data: IncidentUpdate
     ) -> Optional[Incident]:
         """Update an incident"""
-        incident = await IncidentService.get_incident(db, incident_id)
+        update_data = incident_data.model_dump(exclude_unset=True)
+        
+        incident = await IncidentService._update_returning(
+            db, incident_id, {**update_data, "updated_at": datetime.utcnow()}
+        )
         
         if not incident:
             return None
         
-        # Update fields
-        update_data = incident_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(incident, field, value)
-        
-        incident.updated_at = datetime.utcnow()
-        
-        await db.flush()
-        await db.refresh(incident)
+        _invalidate_after_commit(db)
         
         audit_logger.log_action(
             action="update",
@@ -140,18 +256,36 @@ class IncidentService:
         
         return incident
     
+    @staticmethod
+    async def _update_returning(
+        db: AsyncSession,
+        incident_id: UUID,
+        values: Dict[str, Any]
+    ) -> Optional[Incident]:
+        """Apply column values with one UPDATE ... RETURNING; None if not found"""
+        result = await db.execute(
+            update(Incident)
+            .where(Incident.id == incident_id)
+            .values(**values)
+            .returning(Incident)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+    
     @staticmethod
     async def delete_incident(
         db: AsyncSession,
         incident_id: UUID
     ) -> bool:
         """Delete an incident"""
-        incident = await IncidentService.get_incident(db, incident_id)
+        result = await db.execute(
+            delete(Incident).where(Incident.id == incident_id).returning(Incident.id)
+        )
         
-        if not incident:
+        if result.scalar_one_or_none() is None:
             return False
         
-        await db.delete(incident)
+        _invalidate_after_commit(db)
         
         audit_logger.log_action(
             action="delete",
@@ -162,32 +296,43 @@ class IncidentService:
         
         return True
     
+    @staticmethod
+    def _quantize(embedding: Any) -> tuple[bytes, float]:
+        """int8-quantize an embedding for storage"""
+        from app.modules.ai.service import quantize_embedding
+        quantized, scale = quantize_embedding(embedding)
+        return quantized.tobytes(), scale
+    
     @staticmethod
     async def update_ai_fields(
         db: AsyncSession,
         incident_id: UUID,
         waste_type: str,
         confidence: float,
-        embedding: List[float],
+        embedding: Any,
         keywords: List[str],
         similar_incident_ids: List[UUID] = None
     ) -> Optional[Incident]:
         """Update AI-generated fields for an incident"""
-        incident = await IncidentService.get_incident(db, incident_id)
+        embedding_i8, embedding_scale = IncidentService._quantize(embedding)
+        values = {
+            "waste_type": waste_type,
+            "waste_type_confidence": confidence,
+            "embedding": embedding,
+            "embedding_i8": embedding_i8,
+            "embedding_scale": embedding_scale,
+            "keywords": keywords,
+        }
         
-        if not incident:
-            return None
+        if similar_incident_ids:
+            values["similar_incident_ids"] = list(similar_incident_ids)
         
-        incident.waste_type = waste_type
-        incident.waste_type_confidence = confidence
-        incident.embedding = embedding
-        incident.keywords = keywords
+        incident = await IncidentService._update_returning(db, incident_id, values)
         
-        if similar_incident_ids:
-            incident.similar_incident_ids = [str(id) for id in similar_incident_ids]
+        if not incident:
+            return None
         
-        await db.flush()
-        await db.refresh(incident)
+        _invalidate_after_commit(db)
         
         logger.info(
             "AI fields updated",
@@ -8,17 +8,32 @@ This script generates realistic waste incident data for demonstration purposes:
 - Realistic descriptions using templates
 """
 import asyncio
-import random
-from datetime import datetime, timedelta
+import contextlib
+import math
+import uuid
+from datetime import datetime
 from typing import List, Dict, Any
 
+import numpy as np
+from pgvector.utils import HalfVector
+from sqlalchemy import select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import AsyncSessionLocal
 from app.modules.incidents.models import Incident
-from app.modules.ai.service import AIService
+from app.modules.ai.service import AIService, quantize_embedding
 from app.core.logging import logger
 
 
+# Incidents planned, enriched and loaded per chunk (bounds memory for large counts)
+SEED_CHUNK_SIZE = 10_000
+
+# Column order of the records built by DataSeeder.build_incident_record
+COPY_COLUMNS = [
+    "id", "description", "timestamp", "location", "latitude", "longitude",
+    "waste_type", "waste_type_confidence", "keywords", "embedding",
+    "embedding_i8", "embedding_scale", "created_at", "updated_at",
+]
+
 # Realistic incident templates by waste type
 INCIDENT_TEMPLATES = {
     "plastic": [
@@ -144,11 +159,68 @@ WASTE_TYPE_WEIGHTS = {
 }
 
 
+def _build_alias_table(weights: List[float]) -> tuple:
+    """
+    Walker/Vose alias table for O(1) weighted sampling
+    
+    Returns (prob, alias) arrays: draw a uniform column k and a uniform u,
+    and take k when u < prob[k], otherwise alias[k].
+    """
+    n = len(weights)
+    scaled = np.asarray(weights, dtype=float) * n / sum(weights)
+    prob = np.ones(n)
+    alias = np.arange(n)
+    
+    small = [i for i in range(n) if scaled[i] < 1.0]
+    large = [i for i in range(n) if scaled[i] >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+    # Whatever remains is 1.0 up to rounding error and keeps prob 1
+    
+    return prob, alias
+
+
+def _sample_alias(rng: np.random.Generator, table: tuple, count: int) -> np.ndarray:
+    """Draw count indices from an alias table"""
+    prob, alias = table
+    k = rng.integers(0, len(prob), count)
+    return np.where(rng.random(count) < prob[k], k, alias[k])
+
+
+# Sampling tables built once
+_WASTE_TYPES = tuple(WASTE_TYPE_WEIGHTS)
+_WASTE_ALIAS = _build_alias_table(list(WASTE_TYPE_WEIGHTS.values()))
+_LOCATION_ALIAS = _build_alias_table([loc[1] for loc in LOCATIONS])
+# LOCATIONS split into parallel columns, so coordinates are gathered by
+# fancy indexing rather than per-row tuple unpacking
+_LOCATION_NAMES = tuple(loc[0] for loc in LOCATIONS)
+_LOCATION_LAT = np.array([loc[2] for loc in LOCATIONS])
+_LOCATION_LON = np.array([loc[3] for loc in LOCATIONS])
+_PLASTIC_INDEX = _WASTE_TYPES.index("plastic")
+
+# Templates split around their single {location} placeholder, so a
+# description is plain concatenation instead of str.format
+_COMPILED_TEMPLATES: Dict[str, List[tuple]] = {
+    waste_type: [tuple(template.split("{location}")) for template in templates]
+    for waste_type, templates in INCIDENT_TEMPLATES.items()
+}
+# Compiled templates and their counts by waste type index (see _WASTE_TYPES)
+_TEMPLATES_BY_INDEX = tuple(_COMPILED_TEMPLATES[waste_type] for waste_type in _WASTE_TYPES)
+_TEMPLATE_COUNTS = np.array([len(templates) for templates in _TEMPLATES_BY_INDEX])
+
+
 class DataSeeder:
     """Generate and insert realistic mock data"""
     
     def __init__(self):
         self.ai_service = None
+        # AI results per (description, location); generated descriptions
+        # repeat heavily (templates x locations), so most rows are hits
+        self._ai_results: Dict[tuple, asyncio.Future] = {}
     
     async def initialize(self):
         """Initialize AI service"""
@@ -156,63 +228,176 @@ class DataSeeder:
         await self.ai_service.initialize()
         logger.info("AI Service initialized for seeding")
     
-    def generate_weighted_choice(self, items: List[tuple], weights: List[float]) -> Any:
-        """Choose item based on weights"""
-        return random.choices(items, weights=weights, k=1)[0]
-    
-    def generate_timestamp(self, days_ago_range: tuple = (0, 60)) -> datetime:
-        """Generate random timestamp within range"""
-        min_days, max_days = days_ago_range
-        days_ago = random.randint(min_days, max_days)
-        hours_ago = random.randint(0, 23)
-        minutes_ago = random.randint(0, 59)
+    def plan_incidents(
+        self,
+        count: int,
+        create_trends: bool = True,
+        offset: int = 0,
+        total: int = None
+    ) -> List[tuple]:
+        """
+        Sample incidents as (description, location, lat, lon, timestamp)
         
-        return datetime.utcnow() - timedelta(
-            days=days_ago,
-            hours=hours_ago,
-            minutes=minutes_ago
-        )
-    
-    def generate_incident_description(self, waste_type: str, location: str) -> str:
-        """Generate realistic incident description"""
-        if waste_type in INCIDENT_TEMPLATES:
-            template = random.choice(INCIDENT_TEMPLATES[waste_type])
-            return template.format(location=location)
-        return f"Waste incident at {location}"
+        All random draws are made as NumPy arrays in one call each; only
+        materializing the rows is done per incident. When planning a run in
+        chunks, offset and total place this chunk within the whole run so
+        the trend covers the run's first incidents, not each chunk's.
+        """
+        total = count if total is None else total
+        rng = np.random.default_rng()
+        
+        # Select waste types and locations based on weights
+        waste_idx = _sample_alias(rng, _WASTE_ALIAS, count)
+        location_idx = _sample_alias(rng, _LOCATION_ALIAS, count)
+        max_days = np.full(count, 60)
+        
+        if create_trends:
+            # Create recent trend for plastic (last 2 weeks): 60% of the
+            # first 30% of incidents
+            trend = np.zeros(count, dtype=bool)
+            trend_count = min(max(math.ceil(total * 0.3) - offset, 0), count)
+            trend[:trend_count] = rng.random(trend_count) < 0.6
+            waste_idx[trend] = _PLASTIC_INDEX
+            max_days[trend] = 14
+        
+        days_ago = rng.integers(0, max_days + 1)
+        hours_ago = rng.integers(0, 24, count)
+        minutes_ago = rng.integers(0, 60, count)
+        # Template index within each incident's waste type, drawn for all rows at once
+        template_idx = (rng.random(count) * _TEMPLATE_COUNTS[waste_idx]).astype(np.intp)
+        
+        # Offsets are subtracted from one base time as an array; tolist()
+        # converts back to datetime objects for asyncpg in a single call
+        offsets = days_ago * 86400 + hours_ago * 3600 + minutes_ago * 60
+        base = np.datetime64(datetime.utcnow(), "us")
+        timestamps = (base - offsets.astype("timedelta64[s]")).tolist()
+        
+        latitudes = _LOCATION_LAT[location_idx].tolist()
+        longitudes = _LOCATION_LON[location_idx].tolist()
+        locations = [_LOCATION_NAMES[i] for i in location_idx.tolist()]
+        
+        plan = []
+        for waste_i, template_i, location, latitude, longitude, timestamp in zip(
+            waste_idx.tolist(), template_idx.tolist(), locations, latitudes, longitudes, timestamps
+        ):
+            prefix, suffix = _TEMPLATES_BY_INDEX[waste_i][template_i]
+            description = prefix + location + suffix
+            
+            plan.append((description, location, latitude, longitude, timestamp))
+        
+        return plan
     
-    async def create_incident(
+    def build_incident_record(
         self,
-        db: AsyncSession,
+        ai_result: Dict[str, Any],
         description: str,
         location: str,
         latitude: float,
         longitude: float,
         timestamp: datetime
-    ) -> Incident:
-        """Create single incident with AI processing"""
+    ) -> tuple:
+        """Combine an incident with its AI results (from _process_incident) into a COPY record (see COPY_COLUMNS)"""
+        now = datetime.utcnow()
+        
+        return (
+            uuid.uuid4(),
+            description,
+            timestamp,
+            location,
+            latitude,
+            longitude,
+            ai_result['waste_type'],
+            ai_result['confidence'],
+            ai_result['keywords'],
+            ai_result['embedding'],
+            ai_result['embedding_i8'],
+            ai_result['embedding_scale'],
+            now,
+            now
+        )
+    
+    async def _process_incident(self, description: str, location: str) -> Dict[str, Any]:
+        """
+        AI result with the embedding already in its stored forms
+        
+        The float32 embedding is narrowed to a halfvec (what the column and
+        the binary COPY codec take) and int8-quantized once per description
+        rather than once per row.
+        """
+        ai_result = await self.ai_service.process_incident(description, location)
+        embedding_i8, embedding_scale = quantize_embedding(ai_result['embedding'])
+        
+        return {
+            **ai_result,
+            'embedding': HalfVector(ai_result['embedding']),
+            'embedding_i8': embedding_i8.tobytes(),
+            'embedding_scale': embedding_scale
+        }
+    
+    def _submit_ai(self, plan: List[tuple]) -> asyncio.Future:
+        """
+        Start AI processing for planned incidents in the background
+        
+        Only descriptions not seen earlier in the run are sent to the AI
+        service; the rest share the pending or finished result. Resolves to
+        one result dict (or exception) per row, in order.
+        """
+        results = []
+        for description, location, *_ in plan:
+            key = (description, location)
+            if key not in self._ai_results:
+                self._ai_results[key] = asyncio.ensure_future(
+                    self._process_incident(description, location)
+                )
+            results.append(self._ai_results[key])
+        
+        return asyncio.gather(*results, return_exceptions=True)
+    
+    async def enrich_incidents(self, plan: List[tuple]) -> List[tuple]:
+        """
+        Run AI processing for planned incidents and build their COPY records
+        
+        Every incident is submitted at once; the embedding micro-batcher
+        groups them into batched forward passes. Incidents the AI service
+        fails on are logged and left out.
+        """
+        ai_results = await self._submit_ai(plan)
+        
+        records = []
+        for index, (ai_result, row) in enumerate(zip(ai_results, plan)):
+            if isinstance(ai_result, Exception):
+                logger.error(f"Error creating incident {index}: {str(ai_result)}")
+                continue
+            records.append(self.build_incident_record(ai_result, *row))
+        
+        return records
+    
+    async def copy_incidents(self, db: AsyncSession, records: List[tuple]):
+        """
+        Bulk-load incident records with a single binary COPY
+        
+        Runs on the session's asyncpg connection, inside its transaction.
+        The halfvec codec is only registered for the duration of the COPY so
+        the pooled connection keeps SQLAlchemy's text-based vector handling.
+        """
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        
+        await driver_connection.set_type_codec(
+            'halfvec',
+            encoder=HalfVector._to_db_binary,
+            decoder=HalfVector._from_db_binary,
+            format='binary'
+        )
         try:
-            # Process with AI
-            ai_result = await self.ai_service.process_incident(description, location)
-            
-            # Create incident
-            incident = Incident(
-                description=description,
-                timestamp=timestamp,
-                location=location,
-                latitude=latitude,
-                longitude=longitude,
-                waste_type=ai_result['waste_type'],
-                waste_type_confidence=ai_result['confidence'],
-                keywords=ai_result['keywords'],
-                embedding=ai_result['embedding']
+            await driver_connection.copy_records_to_table(
+                Incident.__tablename__,
+                records=records,
+                columns=COPY_COLUMNS
             )
-            
-            db.add(incident)
-            return incident
-            
-        except Exception as e:
-            logger.error(f"Error creating incident: {str(e)}")
-            raise
+        finally:
+            await driver_connection.reset_type_codec('halfvec')
     
     async def seed_incidents(
         self,
@@ -223,62 +408,46 @@ class DataSeeder:
         """
         Seed database with realistic incidents
         
+        Three phases: plan (vectorized sampling), enrich (AI), load (COPY).
+        Runs inside the caller's transaction; nothing is committed here.
+        
         Args:
             count: Number of incidents to create
             create_trends: Whether to create trending patterns
         """
         logger.info(f"Starting to seed {count} incidents...")
         
+        self._ai_results = {}
         incidents_created = 0
+        chunks = [
+            (start, min(SEED_CHUNK_SIZE, count - start))
+            for start in range(0, count, SEED_CHUNK_SIZE)
+        ]
         
-        # Generate incidents with time distribution
-        for i in range(count):
-            try:
-                # Select waste type based on weights
-                waste_types = list(WASTE_TYPE_WEIGHTS.keys())
-                weights = list(WASTE_TYPE_WEIGHTS.values())
-                
-                # Create recent trend for plastic (last 2 weeks)
-                if create_trends and i < count * 0.3 and random.random() < 0.6:
-                    # 30% of incidents in last 2 weeks, 60% plastic for trend
-                    waste_type = "plastic"
-                    timestamp = self.generate_timestamp((0, 14))
-                else:
-                    waste_type = random.choices(waste_types, weights=weights, k=1)[0]
-                    timestamp = self.generate_timestamp((0, 60))
-                
-                # Select location based on weights
-                location_weights = [loc[1] for loc in LOCATIONS]
-                location_data = self.generate_weighted_choice(LOCATIONS, location_weights)
-                location, _, latitude, longitude = location_data
-                
-                # Generate description
-                description = self.generate_incident_description(waste_type, location)
-                
-                # Create incident
-                await self.create_incident(
-                    db,
-                    description,
-                    location,
-                    latitude,
-                    longitude,
-                    timestamp
-                )
-                
-                incidents_created += 1
+        def enrich_chunk(start: int, size: int) -> asyncio.Task:
+            plan = self.plan_incidents(size, create_trends, offset=start, total=count)
+            return asyncio.create_task(self.enrich_incidents(plan))
+        
+        # One chunk at a time, with the next chunk's AI processing running
+        # while the current one is loaded
+        pending = enrich_chunk(*chunks[0]) if chunks else None
+        try:
+            for index in range(len(chunks)):
+                records = await pending
+                if index + 1 < len(chunks):
+                    pending = enrich_chunk(*chunks[index + 1])
                 
-                # Commit in batches for performance
-                if (i + 1) % 10 == 0:
-                    await db.commit()
-                    logger.info(f"Created {incidents_created}/{count} incidents...")
-                    
-            except Exception as e:
-                logger.error(f"Error creating incident {i}: {str(e)}")
-                await db.rollback()
-                continue
+                if records:
+                    await self.copy_incidents(db, records)
+                incidents_created += len(records)
+                logger.info(f"Created {incidents_created}/{count} incidents...")
+        finally:
+            # A failed COPY must not leave the next chunk's inference running
+            if pending is not None and not pending.done():
+                pending.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await pending
         
-        # Final commit
-        await db.commit()
         logger.info(f"✅ Successfully seeded {incidents_created} incidents!")
         
         return incidents_created
@@ -289,30 +458,32 @@ class DataSeeder:
         logger.info("DATABASE SEEDING STARTED")
         logger.info("="*60)
         
+        # Check if data already exists before paying for the AI model load
+        async with AsyncSessionLocal() as db:
+            existing_count = await db.scalar(select(func.count(Incident.id))) or 0
+        
+        if existing_count > 0:
+            logger.warning(f"Database already has {existing_count} incidents")
+            logger.info("Skipping seeding. To re-seed, clear database first.")
+            return
+        
         await self.initialize()
         
+        # One transaction for the whole seed; rolled back on any error
         async with AsyncSessionLocal() as db:
             try:
-                # Check if data already exists
-                from sqlalchemy import select, func
-                result = await db.execute(select(func.count(Incident.id)))
-                existing_count = result.scalar() or 0
-                
-                if existing_count > 0:
-                    logger.warning(f"Database already has {existing_count} incidents")
-                    logger.info("Skipping seeding. To re-seed, clear database first.")
-                    return
-                
-                # Seed data
-                incidents_created = await self.seed_incidents(db, count=count)
-                await db.commit()
+                async with db.begin():
+                    # Bulk COPY chunks may legitimately exceed the API statement timeout
+                    await db.execute(text("SET LOCAL statement_timeout = 0"))
+                    
+                    # Seed data
+                    incidents_created = await self.seed_incidents(db, count=count)
                 
                 logger.info("="*60)
                 logger.info("DATABASE SEEDING COMPLETED")
                 logger.info(f"Total incidents created: {incidents_created}")
                 logger.info("="*60)
             except Exception as e:
-                await db.rollback()
                 logger.error(f"Failed to seed database: {e}")
                 raise
 
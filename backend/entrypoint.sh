@@ -41,7 +41,7 @@ END
 
 # Initialize database tables
 echo "Initializing database tables..."
-python << END
+RUN_MIGRATIONS=true python << END
 from app.core.database import init_db
 import asyncio
 